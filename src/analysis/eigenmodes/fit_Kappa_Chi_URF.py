@@ -4,16 +4,23 @@ from __future__ import annotations
 
 # ── Python stdlib ────────────────────────────────────────────────────
 import math
+import sys
+from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Sequence, Iterable
 import contextlib
 
 # ── Third-party ──────────────────────────────────────────────────────
 import numpy as np
-import pandas as pd
 from scipy.optimize import least_squares
 from scipy.optimize import linear_sum_assignment
-import trap_sim as model
+
+# When run as a script, make the src/ packages importable; imported as
+# part of the package, sys.path is left untouched
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from analysis.eigenmodes import trap_sim as model
 
 
 # ── Data containers ──────────────────────────────────────────────────
@@ -218,6 +225,8 @@ def fit_chi_kappa_multi(
     best = res.x
 
     # Build per-dataset matched tables for reporting
+    import pandas as pd  # deferred: keeps pandas out of importing this module
+
     per_tables: list[pd.DataFrame] = []
     for ds in datasets:
         try:
@@ -13,8 +13,6 @@ from typing import Iterable, Sequence, Tuple
 
 # ── Third-party ──────────────────────────────────────────────────────
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from functools import partial
 from scipy.optimize import minimize
 
@@ -522,6 +520,8 @@ def _label_two(vec: np.ndarray) -> str:
 
 
 def modes_dataframe(freqs_Hz, V):
+    import pandas as pd  # deferred: only DataFrame users pay for pandas
+
     freqs = np.asarray(freqs_Hz); V = np.asarray(V)
     N = V.shape[0] // 3
     cols = ["Mode", "freq [kHz]"] + [f"{axis}{i + 1}" for i in range(N) for axis in "xyz"]
@@ -544,7 +544,7 @@ def modes_dataframe(freqs_Hz, V):
 # Simple CLI that saves the table as PNG
 # -------------------------------------------------------------------
 
-def _format_df(df: pd.DataFrame) -> pd.DataFrame:
+def _format_df(df: "pd.DataFrame") -> "pd.DataFrame":
     df2 = df.copy()
     df2["freq [kHz]"] = df2["freq [kHz]"].map(lambda x: f"{x:,.3f}")
     for col in df2.columns[2:]:
@@ -553,6 +553,9 @@ def _format_df(df: pd.DataFrame) -> pd.DataFrame:
 
 
 if __name__ == "__main__":
+    # Only the interactive demo plots; keep matplotlib out of library imports
+    import matplotlib.pyplot as plt
+
     line = input(
         "Enter ion mass numbers (u) separated by spaces "
         "(blank line to quit):\n> "
@@ -23,9 +23,7 @@ from typing import Iterable, Sequence, Tuple, Dict, Any, Optional
 
 # ── Third-party ──────────────────────────────────────────────────────
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from functools import partial
+from functools import lru_cache, partial
 from scipy.optimize import minimize
 import warnings
 
@@ -81,6 +79,15 @@ def alpha_coeffs(m_kg: float, *, q=E_CH, u_rf: float, omega: float, r0: float,
     return np.array([pref * chi_x, pref * chi_y, 0.0], dtype=float)
 
 
+@lru_cache(maxsize=1024)
+def _pseudo_coeffs(u_rf: float, rf_mhz: float, mass_A: float, r0: float,
+                   chi_x: float, chi_y: float) -> Tuple[float, float, float]:
+    """Cached ``alpha_coeffs`` for one ion species; sweeps repeat the same keys."""
+    a = alpha_coeffs(mass_from_A(mass_A), u_rf=u_rf, omega=_get_omega(rf_mhz),
+                     r0=r0, chi_vec=(chi_x, chi_y))
+    return float(a[0]), float(a[1]), float(a[2])
+
+
 def beta_coeffs(*, q=E_CH, ec1: float, ec2: float, z0: float,
                 kappa_vec: Sequence[float]) -> Tuple[np.ndarray, float]:
     """
@@ -224,6 +231,7 @@ def pos_find(
     *,
     alpha_fn,
     beta_fn,
+    alpha_all=None,
     charges=None,
     softening=0.1,
     init="linear",
@@ -246,6 +254,8 @@ def pos_find(
         Function returning alpha coefficients for a given mass.
     beta_fn : callable
         Function returning (beta_quad, gamma_z) coefficients.
+    alpha_all : ndarray, optional
+        Precomputed (N, 3) alpha coefficients; when given, alpha_fn is not called.
     charges : array_like, optional
         Ion charges in C. Defaults to +e for all.
     softening : float
@@ -318,13 +328,17 @@ def pos_find(
     beta_quad, gamma_z = beta_fn()
     beta_quad = np.asarray(beta_quad, dtype=float)
     gamma_z = float(gamma_z)
-    alpha_all = np.vstack([np.asarray(alpha_fn(m_kg=m), float) for m in masses])
+    if alpha_all is None:
+        alpha_all = np.vstack([np.asarray(alpha_fn(m_kg=m), float) for m in masses])
+    else:
+        alpha_all = np.asarray(alpha_all, dtype=float).reshape(N, 3)
+    # Quadratic trap coefficients are fixed for the whole minimisation
+    coeff = alpha_all + beta_quad[np.newaxis, :]
 
     def energy_and_grad(x):
         R = _unpack(x)
 
         # Trap: quadratic terms
-        coeff = alpha_all + beta_quad[np.newaxis, :]
         trap_E_quad = float(np.sum(coeff * (R**2)))
         trap_g_quad = 2.0 * coeff * R
 
@@ -513,18 +527,31 @@ def calculate_eigenmode(
             ec1=ec1, ec2=ec2, z0=z_0, kappa_vec=kappa
         )
 
-    # Radial stability check
-    α_all = np.vstack([_alpha_fn(m_i) for m_i in masses_kg])
+    # Radial stability check (pseudopotential coefficients cached per species)
+    chi_x, chi_y = float(chi[0]), float(chi[1])
+    α_all = np.array(
+        [_pseudo_coeffs(float(u_rf), float(rf_mhz), float(A), float(r_0), chi_x, chi_y)
+         for A in masses],
+        dtype=float,
+    )
     β_quad, γ_z = _beta_fn()
     βx, βy, βz = β_quad
     if np.any((α_all[:, 0] + βx) <= 0.0) or np.any((α_all[:, 1] + βy) <= 0.0):
         raise ValueError("Chosen parameters give radial instability (α+β ≤ 0).")
 
+    # A lone ion has no Coulomb coupling: its equilibrium and modes are closed
+    # form, so skip the multistart minimisation and the eigensolver
+    if N == 1 and βz > 0.0:
+        z_star = -γ_z / (2.0 * βz)
+        if box is None or abs(z_star) <= box[2]:
+            return _single_ion_modes(masses_kg[0], α_all[0], β_quad, z_star)
+
     # Find equilibrium positions
     positions_opt, res = pos_find(
         masses_kg,
         alpha_fn=_alpha_fn,
         beta_fn=_beta_fn,
+        alpha_all=α_all,
         softening=softening,
         box=box,
         n_restarts=n_restarts,
@@ -546,6 +573,20 @@ def calculate_eigenmode(
     return freqs_hz, eigenvectors, z_eq, coords
 
 
+def _single_ion_modes(
+    m_kg: float,
+    alpha: np.ndarray,
+    beta_quad: np.ndarray,
+    z_eq: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Modes of one ion: three uncoupled oscillators along x, y, z."""
+    stiffness = 2.0 * (np.asarray(alpha, dtype=float) + beta_quad)
+    freqs_hz = np.sqrt(np.clip(stiffness / m_kg, 0.0, None)) / (2.0 * math.pi)
+    order = np.argsort(freqs_hz, kind="stable")  # ascending, as eigh returns them
+    coords = np.array([[0.0, 0.0, z_eq]])
+    return freqs_hz[order], np.eye(3)[:, order], coords[:, 2].copy(), coords
+
+
 def _build_hessian(
     coords: np.ndarray,
     masses: np.ndarray,
@@ -566,6 +607,7 @@ def _build_hessian(
 
     # Coulomb contributions
     C = K_E * (E_CH**2)
+    I3 = np.eye(3)
     for i in range(N - 1):
         ri = coords[i]
         for j in range(i + 1, N):
@@ -576,8 +618,7 @@ def _build_hessian(
                 raise RuntimeError("Two ions have zero separation at equilibrium.")
             r = math.sqrt(r2)
             r5 = r2 * r2 * r
-            I3 = np.eye(3)
-            G = C * (3.0 * np.outer(d, d) - r2 * I3) / r5
+            G = (C / r5) * (3.0 * np.outer(d, d) - r2 * I3)
 
             i_slice = slice(3*i, 3*i+3)
             j_slice = slice(3*j, 3*j+3)
@@ -596,8 +637,8 @@ def _diagonalize_hessian(
     """Diagonalize mass-weighted Hessian to get eigenfrequencies and eigenvectors."""
     M_inv_sqrt = np.repeat(1.0 / np.sqrt(masses), 3)
     K = (M_inv_sqrt[:, None] * H) * M_inv_sqrt[None, :]
+    # eigh already returns orthonormal eigenvectors, no renormalization needed
     lam, V = np.linalg.eigh(K)
-    V = V / np.linalg.norm(V, axis=0, keepdims=True)
     freqs_hz = np.sqrt(np.clip(lam, 0.0, None)) / (2.0 * math.pi)
     return freqs_hz, V
 
@@ -609,6 +650,9 @@ def _diagonalize_hessian(
 def _eigenmodes_from_list(
     A_list: Sequence[int],
     *,
+    u_rf: Optional[float] = None,
+    ec1: Optional[float] = None,
+    ec2: Optional[float] = None,
     chi_vec: Tuple[float, float] = tuple(chi),
     kappa_vec: Tuple[float, float, float] = tuple(kappa),
     tol: float = 1e-12,
@@ -621,18 +665,24 @@ def _eigenmodes_from_list(
     """
     Backward compatibility wrapper. Use calculate_eigenmode() instead.
     
-    Computes eigenmodes using global u_RF, EC1, EC2 values.
+    Computes eigenmodes using u_rf, ec1, ec2 when given, otherwise the
+    global u_RF, EC1, EC2 values.
     """
     import warnings
     warnings.warn("_eigenmodes_from_list is deprecated, use calculate_eigenmode() instead",
                   DeprecationWarning)
     
-    # Use global values for backward compatibility
-    global u_RF, EC1, EC2
+    # Fall back to global values for backward compatibility
+    if u_rf is None:
+        u_rf = u_RF
+    if ec1 is None:
+        ec1 = EC1
+    if ec2 is None:
+        ec2 = EC2
     return calculate_eigenmode(
-        u_rf=u_RF,
-        ec1=EC1,
-        ec2=EC2,
+        u_rf=u_rf,
+        ec1=ec1,
+        ec2=ec2,
         masses=A_list,
         r_0=r_0,
         z_0=z_0,
@@ -650,6 +700,9 @@ def _eigenmodes_from_list(
 def eigenmodes_from_masses(
     A_seq: Iterable[int],
     *,
+    u_rf: Optional[float] = None,
+    ec1: Optional[float] = None,
+    ec2: Optional[float] = None,
     chi_vec: Tuple[float, float] = tuple(chi),
     kappa_vec: Tuple[float, float, float] = tuple(kappa),
     **kwargs,
@@ -658,12 +711,17 @@ def eigenmodes_from_masses(
     Backward compatibility wrapper. Use calculate_eigenmode() instead.
     
     Compute normal modes for a sequence of integer mass numbers.
+    u_rf, ec1 and ec2 default to the module globals when not given;
+    passing them explicitly avoids patching globals and is thread-safe.
     """
     import warnings
     warnings.warn("eigenmodes_from_masses is deprecated, use calculate_eigenmode() instead",
                   DeprecationWarning)
     return _eigenmodes_from_list(
         list(A_seq), 
+        u_rf=u_rf,
+        ec1=ec1,
+        ec2=ec2,
         chi_vec=chi_vec, 
         kappa_vec=kappa_vec,
         **kwargs
@@ -684,27 +742,42 @@ def _label_two(vec: np.ndarray) -> str:
     return f"Radial ({'x' if axis == 0 else 'y'})"
 
 
-def modes_dataframe(freqs_hz, V):
-    """Create a pandas DataFrame with mode information."""
+_TWO_ION_ORDER = [
+    "Axial in-phase", "Axial out-of-phase",
+    "Radial (y)", "Radial (x)", "Radial (y)", "Radial (x)"
+]
+
+
+def modes_table(freqs_hz, V):
+    """
+    Mode table as plain arrays (the content of modes_dataframe()).
+
+    Returns (columns, labels, values): column names, one label per mode,
+    and a (3N, 1 + 3N) array of [freq kHz, eigenvector components] rows.
+    """
     freqs = np.asarray(freqs_hz); V = np.asarray(V)
     N = V.shape[0] // 3
     cols = ["Mode", "freq [kHz]"] + [f"{axis}{i + 1}" for i in range(N) for axis in "xyz"]
-    rows = []
-    for k in range(3 * N):
-        label = _label_two(V[:, k]) if N == 2 else f"Mode {k}"
-        rows.append([label, freqs[k] / 1e3, *V[:, k]])
-    df = pd.DataFrame(rows, columns=cols)
+    labels = [_label_two(V[:, k]) if N == 2 else f"Mode {k}" for k in range(3 * N)]
+    values = np.column_stack([freqs / 1e3, V.T])
     if N == 2:
-        order = [
-            "Axial in-phase", "Axial out-of-phase",
-            "Radial (y)", "Radial (x)", "Radial (y)", "Radial (x)"
-        ]
-        df["_ord"] = df["Mode"].apply(order.index)
-        df = df.sort_values("_ord").drop(columns="_ord").reset_index(drop=True)
+        order = sorted(range(3 * N), key=lambda k: _TWO_ION_ORDER.index(labels[k]))
+        labels = [labels[k] for k in order]
+        values = values[order]
+    return cols, labels, values
+
+
+def modes_dataframe(freqs_hz, V):
+    """Create a pandas DataFrame with mode information."""
+    import pandas as pd  # deferred: only DataFrame users pay for pandas
+
+    cols, labels, values = modes_table(freqs_hz, V)
+    df = pd.DataFrame(values, columns=cols[1:])
+    df.insert(0, cols[0], labels)
     return df
 
 
-def _format_df(df: pd.DataFrame) -> pd.DataFrame:
+def _format_df(df: "pd.DataFrame") -> "pd.DataFrame":
     """Format DataFrame for display."""
     df2 = df.copy()
     df2["freq [kHz]"] = df2["freq [kHz]"].map(lambda x: f"{x:,.3f}")
@@ -718,6 +791,9 @@ def _format_df(df: pd.DataFrame) -> pd.DataFrame:
 # -------------------------------------------------------------------
 
 if __name__ == "__main__":
+    # Only the interactive demo plots; keep matplotlib out of library imports
+    import matplotlib.pyplot as plt
+
     line = input(
         "Enter ion mass numbers (u) separated by spaces "
         "(blank line to quit):\n> "
@@ -18,13 +18,32 @@ import numpy as np
 import json
 import time
 import logging
-from typing import Dict, Any, Optional, Tuple, List
-from dataclasses import dataclass, asdict
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, List, Union
+from dataclasses import dataclass, fields
 from pathlib import Path
 import sys
 
-# Add parent directories to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from scipy.optimize import least_squares
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# When run as a script, make the src/ packages importable; imported as
+# part of the package, sys.path is left untouched
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import trap simulation
 from analysis.eigenmodes.trap_sim_asy import (
@@ -41,6 +60,99 @@ from core import u_rf_mv_to_U_RF_V, RF_SCALE_V_PER_MV
 logger = logging.getLogger("secular_comparison")
 
 
+# ==============================================================================
+# Lorentzian kernels (JIT-compiled when numba is available)
+# ==============================================================================
+
+def _lorentz_model(x, x0, gamma, amp, bg):
+    """Lorentzian A * Γ² / [(x - x₀)² + Γ²] + BG evaluated over x."""
+    g2 = gamma * gamma
+    d = x - x0
+    return amp * g2 / (d * d + g2) + bg
+
+
+def _lorentz_jac(x, x0, gamma, amp, bg):
+    """Jacobian of _lorentz_model w.r.t. (x0, gamma, amp, bg), shape (N, 4)."""
+    g2 = gamma * gamma
+    d = x - x0
+    d2 = d * d
+    inv = 1.0 / (d2 + g2)
+    jac = np.empty((x.shape[0], 4))
+    jac[:, 0] = 2.0 * amp * g2 * d * inv * inv
+    jac[:, 1] = 2.0 * amp * gamma * d2 * inv * inv
+    jac[:, 2] = g2 * inv
+    jac[:, 3] = 1.0
+    return jac
+
+
+def _resid(p, x, y):
+    """Residual vector model(x; p) - y for least_squares."""
+    return _lorentz_model(x, p[0], p[1], p[2], p[3]) - y
+
+
+def _jac_resid(p, x, y):
+    """Jacobian of _resid w.r.t. p (y is constant)."""
+    return _lorentz_jac(x, p[0], p[1], p[2], p[3])
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile eagerly at import, so the first fit
+    # does not pay the JIT cost; cache=True persists the machine code.
+    _lorentz_model = njit(
+        "float64[:](float64[:], float64, float64, float64, float64)",
+        cache=True, fastmath=True
+    )(_lorentz_model)
+    _lorentz_jac = njit(
+        "float64[:, :](float64[:], float64, float64, float64, float64)",
+        cache=True, fastmath=True
+    )(_lorentz_jac)
+else:
+    def _lorentz_model(x, x0, gamma, amp, bg):
+        """NumPy Lorentzian computed in place: the result is the only allocation."""
+        g2 = gamma * gamma
+        out = np.subtract(x, x0)
+        np.square(out, out=out)
+        out += g2
+        np.divide(amp * g2, out, out=out)
+        out += bg
+        return out
+
+
+@functools.lru_cache(maxsize=128)
+def _compute_eigenmodes(ec1: float, ec2: float, u_rf_real: float,
+                        mass_tuple: Tuple[int, ...]) -> Tuple[Tuple[float, ...], int, np.ndarray]:
+    """
+    Solve the trap eigenmodes for one parameter set (memoized).
+    
+    The key (ec1, ec2, u_rf_real, mass_tuple) fully determines the result,
+    so cached entries never need invalidating.
+    
+    Returns:
+        (frequencies_kHz, index of smallest frequency, its eigenvector)
+    """
+    # Pass parameters explicitly rather than patching trap_sim_asy globals,
+    # so concurrent solves (see sweep_theoretical) do not interfere
+    freqs_hz, V, z_eq, coords = eigenmodes_from_masses(
+        list(mass_tuple),
+        u_rf=u_rf_real,
+        ec1=ec1,
+        ec2=ec2,
+        verbose=False
+    )
+    
+    # Convert to kHz
+    freqs_kHz = freqs_hz / 1000.0
+    
+    # Find smallest frequency (axial secular)
+    min_idx = int(np.argmin(freqs_kHz))
+    
+    # Cached result is shared between callers, so hand out a read-only copy
+    min_vec = V[:, min_idx].copy()
+    min_vec.setflags(write=False)
+    
+    return tuple(freqs_kHz.tolist()), min_idx, min_vec
+
+
 @dataclass
 class SecularComparisonResult:
     """Result of a secular frequency comparison."""
@@ -61,8 +173,8 @@ class SecularComparisonResult:
     # Scan parameters
     scan_center_kHz: float
     scan_range_kHz: float
-    scan_voltages: List[float]
-    scan_results: List[float]
+    scan_voltages: Union[np.ndarray, List[float]]
+    scan_results: Union[np.ndarray, List[float]]
     
     # Analysis results
     signal_detected: bool
@@ -83,11 +195,25 @@ class SecularComparisonResult:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Shallow field walk; asdict() would deep-copy every scan list.
+        # Scan arrays stay as ndarrays internally and are only listified here.
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            elif isinstance(value, np.generic):
+                value = value.item()
+            result[f.name] = value
+        return result
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        return json.dumps(self.to_dict(), indent=2)
 
 
 class LorentzianFitter:
@@ -120,24 +246,48 @@ class LorentzianFitter:
         Returns:
             Model values
         """
-        return amplitude * gamma**2 / ((x - x0)**2 + gamma**2) + background
+        return _lorentz_model(np.asarray(x, dtype=np.float64), float(x0),
+                              float(gamma), float(amplitude), float(background))
     
     @staticmethod
-    def guess_initial_params(x: np.ndarray, y: np.ndarray) -> Dict[str, float]:
+    def jacobian(x: np.ndarray, x0: float, gamma: float, amplitude: float,
+                 background: float = 0) -> np.ndarray:
+        """
+        Analytic Jacobian of the Lorentzian model.
+        
+        Returns:
+            Array of shape (N, 4) with columns d/dx0, d/dgamma,
+            d/damplitude, d/dbackground
+        """
+        return _lorentz_jac(np.asarray(x, dtype=np.float64), float(x0),
+                            float(gamma), float(amplitude), float(background))
+    
+    @staticmethod
+    def guess_initial_params(x: np.ndarray, y: np.ndarray,
+                             ymin: Optional[float] = None,
+                             ymax: Optional[float] = None) -> Dict[str, float]:
         """
         Guess initial parameters from data.
         
+        Args:
+            x: Frequency array
+            y: Signal array
+            ymin: Precomputed min(y) (computed if None)
+            ymax: Precomputed max(y) (computed if None)
+        
         Returns:
             Dictionary with initial parameter estimates
         """
-        # Background as minimum value
-        bg = np.min(y)
+        if ymin is None:
+            ymin = float(np.min(y))
+        if ymax is None:
+            ymax = float(np.max(y))
         
-        # Remove background for amplitude estimate
-        y_no_bg = y - bg
+        # Background as minimum value
+        bg = ymin
         
         # Amplitude is max value above background
-        amplitude = np.max(y_no_bg)
+        amplitude = ymax - bg
         
         # Center is at maximum
         x0 = x[np.argmax(y)]
@@ -164,7 +314,8 @@ class LorentzianFitter:
     
     @staticmethod
     def fit(x: np.ndarray, y: np.ndarray, 
-            initial_guess: Optional[Dict[str, float]] = None) -> Tuple[bool, Dict[str, Any]]:
+            initial_guess: Optional[Dict[str, float]] = None,
+            compute_errors: bool = True) -> Tuple[bool, Dict[str, Any]]:
         """
         Fit Lorentzian to data.
         
@@ -172,6 +323,8 @@ class LorentzianFitter:
             x: Frequency array (kHz)
             y: Signal array (counts or amplitude)
             initial_guess: Optional initial parameter dictionary
+            compute_errors: If False, skip the covariance matrix and
+                            parameter uncertainties (reported as None)
             
         Returns:
             (success, result_dict)
@@ -179,47 +332,59 @@ class LorentzianFitter:
                                  fwhm, chi2, cov_matrix, fit_curve
         """
         try:
-            from scipy.optimize import curve_fit
+            x = np.asarray(x, dtype=np.float64)
+            y = np.asarray(y, dtype=np.float64)
+            ymin = float(np.min(y))
+            ymax = float(np.max(y))
             
             # Guess initial parameters if not provided
             if initial_guess is None:
-                initial_guess = LorentzianFitter.guess_initial_params(x, y)
+                initial_guess = LorentzianFitter.guess_initial_params(x, y, ymin, ymax)
             
-            p0 = [
+            p0 = np.array([
                 initial_guess['x0'],
                 initial_guess['gamma'],
                 initial_guess['amplitude'],
                 initial_guess['background']
-            ]
+            ], dtype=np.float64)
             
             # Set bounds to keep parameters physical
-            bounds = ([
+            bounds = (np.array([
                 x[0],  # x0 >= min(x)
                 0.01,  # gamma >= 0.01 kHz
                 0,     # amplitude >= 0
                 0      # background >= 0
-            ], [
+            ], dtype=np.float64), np.array([
                 x[-1],  # x0 <= max(x)
                 (x[-1] - x[0]),  # gamma <= full range
-                np.max(y) * 10,  # amplitude <= 10x max
-                np.max(y)        # background <= max(y)
-            ])
+                ymax * 10,  # amplitude <= 10x max
+                ymax        # background <= max(y)
+            ], dtype=np.float64))
             
-            # Fit
-            popt, pcov = curve_fit(
-                LorentzianFitter.model, x, y, p0=p0, bounds=bounds,
-                maxfev=10000
+            # Fit (same TRF solver curve_fit uses, without its wrapping)
+            res = least_squares(
+                _resid, p0, jac=_jac_resid, bounds=bounds, args=(x, y),
+                method='trf', x_scale='jac', max_nfev=10000
             )
+            if not res.success:
+                raise RuntimeError(f"Optimal parameters not found: {res.message}")
             
-            x0, gamma, amplitude, background = popt
+            x0, gamma, amplitude, background = res.x
             
-            # Calculate fit quality
-            y_fit = LorentzianFitter.model(x, *popt)
-            residuals = y - y_fit
-            chi2 = np.sum(residuals**2) / (len(y) - 4)  # Reduced chi2
+            # Calculate fit quality (res.fun = y_fit - y)
+            residuals = -res.fun
+            y_fit = y + res.fun
+            dof = len(y) - 4
+            chi2 = 2 * res.cost / dof  # Reduced chi2
             
             # Parameter uncertainties
-            perr = np.sqrt(np.diag(pcov))
+            if compute_errors:
+                J = res.jac
+                pcov = np.linalg.pinv(J.T @ J) * chi2
+                perr = np.sqrt(np.diag(pcov))
+            else:
+                pcov = None
+                perr = [None] * 4
             
             return True, {
                 'x0': x0,
@@ -231,7 +396,7 @@ class LorentzianFitter:
                 'background': background,
                 'background_err': perr[3],
                 'fwhm': 2 * gamma,
-                'fwhm_err': 2 * perr[1],
+                'fwhm_err': 2 * perr[1] if compute_errors else None,
                 'chi2': chi2,
                 'cov_matrix': pcov,
                 'fit_curve': y_fit,
@@ -268,6 +433,10 @@ class SecularFrequencyComparator:
     SCAN_POINTS = 41       # Number of points in scan
     SCAN_DWELL_MS = 100    # Dwell time per point
     
+    # Peak-to-peak signal (in the units of the scanned signal) at or below
+    # which a scan is treated as flat; 0 only skips exactly flat scans
+    NOISE_FLOOR = 0.0
+    
     def __init__(self):
         self.logger = logger
         self.fitter = LorentzianFitter()
@@ -295,64 +464,62 @@ class SecularFrequencyComparator:
         self.logger.info(f"Calculating secular frequencies for U_RF = {u_rf_real:.1f} V "
                         f"({u_rf_mV} mV on SMILE)")
         
-        # Set global parameters for trap_sim_asy
-        # Note: We need to temporarily modify the global variables
-        import server.analysis.eigenmodes.trap_sim_asy as trap_sim
+        freqs, min_idx, min_vec = _compute_eigenmodes(
+            params.get('ec1', self.DEFAULT_PARAMS['ec1']),
+            params.get('ec2', self.DEFAULT_PARAMS['ec2']),
+            u_rf_real,
+            tuple(mass_numbers)
+        )
+        freqs_kHz = list(freqs)
+        smallest_freq = freqs_kHz[min_idx]
         
-        original_u_RF = trap_sim.u_RF
-        original_EC1 = trap_sim.EC1
-        original_EC2 = trap_sim.EC2
+        # Determine mode name
+        if len(mass_numbers) == 2:
+            # For 2 ions, use the eigenvector to determine mode
+            mode_name = self._identify_mode(min_vec)
+        else:
+            mode_name = f"Mode {min_idx}"
         
-        try:
-            # Set new parameters
-            trap_sim.u_RF = u_rf_real
-            trap_sim.EC1 = params.get('ec1', self.DEFAULT_PARAMS['ec1'])
-            trap_sim.EC2 = params.get('ec2', self.DEFAULT_PARAMS['ec2'])
-            
-            # Calculate eigenmodes
-            freqs_hz, V, z_eq, coords = eigenmodes_from_masses(
-                mass_numbers,
-                theta_deg=0.0,
-                z_offset=0.0,
-                verbose=False
-            )
-            
-            # Convert to kHz
-            freqs_kHz = freqs_hz / 1000.0
-            
-            # Find smallest frequency (axial secular)
-            min_idx = np.argmin(freqs_kHz)
-            smallest_freq = freqs_kHz[min_idx]
-            
-            # Determine mode name
-            if len(mass_numbers) == 2:
-                # For 2 ions, use the eigenvector to determine mode
-                mode_name = self._identify_mode(V[:, min_idx])
-            else:
-                mode_name = f"Mode {min_idx}"
-            
-            self.logger.info(f"Predicted frequencies: {freqs_kHz}")
-            self.logger.info(f"Smallest frequency: {smallest_freq:.3f} kHz ({mode_name})")
-            
-            return freqs_kHz.tolist(), smallest_freq, mode_name
+        self.logger.info(f"Predicted frequencies: {freqs_kHz}")
+        self.logger.info(f"Smallest frequency: {smallest_freq:.3f} kHz ({mode_name})")
+        
+        return freqs_kHz, smallest_freq, mode_name
+    
+    def sweep_theoretical(self, param_grid: List[Dict[str, float]],
+                          mass_numbers: List[int] = [9, 3]
+                          ) -> List[Tuple[List[float], float, str]]:
+        """
+        Calculate theoretical secular frequencies for many parameter sets.
+        
+        Solves run in a thread pool; the heavy lifting happens in
+        NumPy/SciPy, which release the GIL.
+        
+        Args:
+            param_grid: List of trap parameter dicts (see calculate_theoretical_freqs)
+            mass_numbers: List of ion mass numbers
             
-        finally:
-            # Restore original parameters
-            trap_sim.u_RF = original_u_RF
-            trap_sim.EC1 = original_EC1
-            trap_sim.EC2 = original_EC2
+        Returns:
+            List of (frequencies_kHz, smallest_freq_kHz, mode_name), in
+            the same order as param_grid
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                executor.submit(self.calculate_theoretical_freqs, params, mass_numbers)
+                for params in param_grid
+            ]
+            return [f.result() for f in futures]
     
     def _identify_mode(self, eigenvector: np.ndarray) -> str:
         """Identify mode type from eigenvector."""
-        # For 2 ions, eigenvector has shape (6,) for [x1,y1,z1,x2,y2,z2]
-        ex = eigenvector[0]**2 + eigenvector[3]**2
-        ey = eigenvector[1]**2 + eigenvector[4]**2
-        ez = eigenvector[2]**2 + eigenvector[5]**2
+        # Eigenvector is laid out [x1,y1,z1,x2,y2,z2,...]; view as (N_ions, 3)
+        v = np.asarray(eigenvector).reshape(-1, 3)
+        axis_energy = np.einsum('ij,ij->j', v, v)
         
-        axis = int(np.argmax([ex, ey, ez]))
+        axis = int(axis_energy.argmax())
         
         if axis == 2:  # Z-axis (axial)
-            if np.sign(eigenvector[2]) == np.sign(eigenvector[5]):
+            signs = np.sign(v[:, 2])
+            if np.all(signs == signs[0]):
                 return "Axial in-phase"
             else:
                 return "Axial out-of-phase"
@@ -412,10 +579,23 @@ class SecularFrequencyComparator:
         Returns:
             (signal_detected, analysis_results)
         """
-        # Check if there's any signal (above noise)
-        noise_level = np.percentile(counts, 10)
-        peak_level = np.max(counts)
-        snr = (peak_level - noise_level) / np.std(counts[counts < np.percentile(counts, 50)])
+        # Cheap O(N) gate: a flat scan cannot contain a peak, so skip the
+        # sort-based SNR estimate entirely (its noise std would be 0)
+        peak_level = float(counts.max())
+        if peak_level - counts.min() <= self.NOISE_FLOOR:
+            self.logger.warning("No clear signal detected in scan (flat signal)")
+            return False, {
+                'reason': 'flat_signal',
+                'snr': 0.0,
+                'peak_level': peak_level
+            }
+        
+        # Check if there's any signal (above noise); one sort gives the
+        # 10th percentile, the peak and the below-median noise sample
+        sorted_counts = np.sort(counts)
+        n = sorted_counts.size
+        noise_level = sorted_counts[n // 10]
+        snr = (peak_level - noise_level) / sorted_counts[:n // 2].std()
         
         self.logger.info(f"Scan SNR: {snr:.2f}")
         
@@ -429,7 +609,8 @@ class SecularFrequencyComparator:
             }
         
         # Attempt Lorentzian fit
-        success, fit_result = self.fitter.fit(frequencies_kHz, counts)
+        # Only centre, width, amplitude and chi2 are used here
+        success, fit_result = self.fitter.fit(frequencies_kHz, counts, compute_errors=False)
         
         if not success:
             self.logger.warning(f"Lorentzian fit failed: {fit_result.get('error')}")
@@ -487,7 +668,7 @@ class SecularFrequencyComparator:
     
     def run_comparison(self, params: Optional[Dict[str, float]] = None,
                        mass_numbers: List[int] = [9, 3],
-                       scan_results: Optional[Tuple[List[float], List[float]]] = None
+                       scan_results: Optional[Tuple[np.ndarray, np.ndarray]] = None
                        ) -> SecularComparisonResult:
         """
         Run complete secular frequency comparison.
@@ -495,7 +676,7 @@ class SecularFrequencyComparator:
         Args:
             params: Trap parameters (uses defaults if None)
             mass_numbers: Ion mass numbers
-            scan_results: Optional (frequencies, counts) from external scan
+            scan_results: Optional (frequencies, counts) arrays from external scan
             
         Returns:
             SecularComparisonResult with all analysis data
@@ -534,7 +715,7 @@ class SecularFrequencyComparator:
             )
         
         # Generate scan voltages
-        scan_voltages = self.generate_scan_voltages(smallest_freq).tolist()
+        scan_voltages = self.generate_scan_voltages(smallest_freq)
         
         result = SecularComparisonResult(
             ec1=params.get('ec1', self.DEFAULT_PARAMS['ec1']),
@@ -558,12 +739,14 @@ class SecularFrequencyComparator:
         
         # If scan results provided, analyze them
         if scan_results is not None:
-            frequencies, counts = scan_results
+            # asarray is a no-op for ndarray inputs
+            frequencies = np.asarray(scan_results[0], dtype=np.float64)
+            counts = np.asarray(scan_results[1], dtype=np.float64)
             result.scan_results = counts
             
             signal_detected, analysis = self.analyze_scan(
-                np.array(frequencies),
-                np.array(counts),
+                frequencies,
+                counts,
                 smallest_freq
             )
             
@@ -590,18 +773,37 @@ class SecularFrequencyComparator:
         return result
     
     def upload_to_data_server(self, result: SecularComparisonResult,
-                              data_client=None) -> bool:
+                              data_client=None, local: bool = False) -> bool:
         """
         Upload comparison results to data server.
         
+        Each metric is sent as its own channel. Without a data_client a
+        DataClient connection is opened, as before.
+        
         Args:
             result: Comparison result to upload
-            data_client: Optional DataClient instance
+            data_client: Optional client exposing send_data()
+            local: Store straight into this process's telemetry buffers
+                instead; only meaningful inside the data server process
             
         Returns:
             True if successful
         """
+        # Key metrics as separate channels, skipping missing values
+        values = {
+            "secular_fitted": result.fitted_center_kHz,
+            "secular_diff": result.frequency_difference_kHz,
+            "secular_predicted": result.smallest_freq_kHz,
+        }
+        values = {k: v for k, v in values.items() if v is not None}
+        
         try:
+            if local:
+                from services.comms.data_server import store_data_points
+                store_data_points(values, result.timestamp or time.time())
+                logger.info("Results stored in local telemetry buffers")
+                return True
+            
             if data_client is None:
                 # Try to import and create client
                 from services.comms.data_server import DataClient
@@ -610,14 +812,8 @@ class SecularFrequencyComparator:
                     logger.error("Failed to connect to data server")
                     return False
             
-            # Upload key metrics as separate channels
-            if result.fitted_center_kHz is not None:
-                data_client.send_data("secular_fitted", result.fitted_center_kHz)
-            
-            if result.frequency_difference_kHz is not None:
-                data_client.send_data("secular_diff", result.frequency_difference_kHz)
-            
-            data_client.send_data("secular_predicted", result.smallest_freq_kHz)
+            for channel, value in values.items():
+                data_client.send_data(channel, value)
             
             # Also upload full result as JSON
             # This could be stored in a special channel or file
@@ -690,7 +886,7 @@ def main():
         print(f"True center (simulated): {true_center:.3f} kHz")
         print()
         
-        result = comparator.run_comparison(params, scan_results=(freqs.tolist(), counts.tolist()))
+        result = comparator.run_comparison(params, scan_results=(freqs, counts))
     else:
         # Just calculate theory
         result = comparator.run_comparison(params)
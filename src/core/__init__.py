@@ -9,31 +9,8 @@ This module provides shared functionality used by all components:
 - Enumerations and constants
 """
 
-from .config import get_config, Config
-from .logging import setup_logging, log_safety_trigger
-from .utils import (
-    ExperimentContext,
-    ExperimentTracker,
-    get_tracker,
-    generate_exp_id,
-    create_zmq_socket,
-    connect_with_retry,
-    send_with_timeout,
-    recv_with_timeout,
-    ZMQConnection,
-    HeartbeatSender,
-    SystemMode,
-    AlgorithmState,
-    ExperimentStatus,
-    ExperimentPhase,
-    DataSource,
-    CommandType,
-    MatchQuality,
-    u_rf_mv_to_U_RF_V,
-    U_RF_V_to_u_rf_mv,
-    RF_SCALE_V_PER_MV,
-    RF_SCALE_MV_PER_V
-)
+import importlib
+
 from .exceptions import (
     LabFrameworkError,
     ConnectionError,
@@ -46,6 +23,50 @@ from .exceptions import (
 
 __version__ = "2.0.0"
 
+# Names loaded from their submodule on first access (PEP 562), so importing
+# core (e.g. for the exceptions) does not pull in yaml and zmq up front
+_LAZY_ATTRS = {
+    'get_config': 'config',
+    'Config': 'config',
+    'setup_logging': 'logging',
+    'log_safety_trigger': 'logging',
+    'ExperimentContext': 'utils',
+    'ExperimentTracker': 'utils',
+    'get_tracker': 'utils',
+    'generate_exp_id': 'utils',
+    'create_zmq_socket': 'utils',
+    'connect_with_retry': 'utils',
+    'send_with_timeout': 'utils',
+    'recv_with_timeout': 'utils',
+    'ZMQConnection': 'utils',
+    'HeartbeatSender': 'utils',
+    'SystemMode': 'utils',
+    'AlgorithmState': 'utils',
+    'ExperimentStatus': 'utils',
+    'ExperimentPhase': 'utils',
+    'DataSource': 'utils',
+    'CommandType': 'utils',
+    'MatchQuality': 'utils',
+    'u_rf_mv_to_U_RF_V': 'utils',
+    'U_RF_V_to_u_rf_mv': 'utils',
+    'RF_SCALE_V_PER_MV': 'utils',
+    'RF_SCALE_MV_PER_V': 'utils',
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_ATTRS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 __all__ = [
     # Configuration
     'get_config',
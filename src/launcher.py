@@ -132,7 +132,7 @@ def get_service_config(name: str) -> Service:
         'applet': Service(
             name='applet',
             port=config.get('services.applet.port', 5051),
-            cmd=[python, "-m", "src.services.applet.app", "--host", "0.0.0.0", "--port", str(config.get('services.applet.port', 5051))],
+            cmd=[python, "-m", "services.applet.app", "--host", "0.0.0.0", "--port", str(config.get('services.applet.port', 5051))],
             color=COLORS['applet'],
             depends_on=['manager']
         ),
@@ -201,6 +201,9 @@ class ServiceManager:
             # Create process
             env = os.environ.copy()
             env['PYTHONUNBUFFERED'] = '1'
+            # Services import their siblings as top-level packages (services.*, core.*)
+            src_dir = str(Path(__file__).parent)
+            env['PYTHONPATH'] = os.pathsep.join(filter(None, [src_dir, env.get('PYTHONPATH')]))
             
             proc = subprocess.Popen(
                 service.cmd,
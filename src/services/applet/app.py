@@ -13,24 +13,32 @@ Endpoints:
     /api/experiments/stream - SSE stream of progress
 """
 
-import sys
+import os
 import json
 import time
 import logging
+import threading
+import weakref
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Generator
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from flask import Flask, render_template, jsonify, request, Response
 from flask_cors import CORS
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Also add src directory to path for imports like 'from analysis...'
-src_dir = project_root / "src"
-if src_dir.exists() and str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
+# Optional production WSGI server (bounded thread pool)
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(
@@ -50,32 +58,182 @@ app = Flask(
 )
 CORS(app)
 
-# Import controller - use absolute imports to work when run as module or script
+# Let browsers cache static assets instead of refetching them per page load
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600  # seconds
+
+# Absolute imports: run with src/ on the path (installed package, or
+# ``python -m services.applet.app`` from src/)
 from services.applet.controllers import controller
 from services.applet import ExperimentStatus
 
-# SSE clients
-sse_clients: list = []
+class BroadcastBuffer:
+    """
+    Shared ring of pre-encoded SSE frames.
+    
+    Publishers append each frame once; every stream keeps its own read
+    cursor (the last sequence number it has sent), so publishing costs the
+    same regardless of how many clients are connected. The ring is bounded,
+    so a stream that falls more than maxlen frames behind skips the oldest
+    ones (progress/status are latest-wins, so stale frames are safe to drop).
+    """
+    
+    def __init__(self, maxlen: int = 64):
+        self._frames: deque = deque(maxlen=maxlen)  # (seq, frame)
+        self._seq = 0
+        self._cond = threading.Condition()
+    
+    @property
+    def seq(self) -> int:
+        """Sequence number of the most recent frame."""
+        return self._seq
+    
+    def publish(self, frame: bytes):
+        """Append a frame and wake all waiting streams."""
+        with self._cond:
+            self._seq += 1
+            self._frames.append((self._seq, frame))
+            self._cond.notify_all()
+    
+    def wait_for(self, last_seq: int, timeout: float) -> Tuple[int, List[bytes], int]:
+        """
+        Wait until frames newer than last_seq exist (or timeout).
+        
+        Returns:
+            (new cursor, frames newer than last_seq in publish order,
+             number of frames already evicted before they could be read)
+        """
+        with self._cond:
+            if self._seq <= last_seq:
+                self._cond.wait(timeout)
+            n_pending = self._seq - last_seq
+            n_new = min(n_pending, len(self._frames))
+            frames = [frame for _, frame in islice(reversed(self._frames), n_new)]
+            frames.reverse()
+            return self._seq, frames, n_pending - n_new
+
+
+# SSE fan-out buffer shared by all streams
+sse_buffer = BroadcastBuffer()
+
+
+class _Client:
+    """Bookkeeping for one open SSE stream."""
+    __slots__ = ("addr", "dropped", "__weakref__")
+    
+    def __init__(self, addr: Optional[str]):
+        self.addr = addr
+        self.dropped = 0
+
+
+# Open SSE streams; entries vanish with their generator, so a client that
+# disconnects without cleanup is never left behind
+sse_clients: "weakref.WeakSet[_Client]" = weakref.WeakSet()
+
+# Each open SSE stream holds a server thread for its lifetime. Streams
+# beyond this limit are refused, and main() gives waitress this many
+# threads on top of the request workers, so streams never starve requests.
+app.config["SSE_MAX_CLIENTS"] = 16
+
+
+def _sse_frame(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a complete SSE data frame."""
+    body = None
+    if ORJSON_AVAILABLE:
+        try:
+            body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles them
+    if body is None:
+        body = json.dumps(payload).encode('utf-8')
+    return b'data: ' + body + b'\n\n'
+
+
+# Response headers for every SSE stream
+_SSE_HEADERS = {
+    'Cache-Control': 'no-cache',
+    'X-Accel-Buffering': 'no',
+    'Content-Encoding': 'identity',  # keep proxies from gzip-buffering the stream
+}
+
+_SSE_HEARTBEAT = b': heartbeat\n\n'
+
+
+# Window over which progress/status updates are coalesced (seconds)
+SSE_COALESCE_INTERVAL = 0.05
+
+
+class _LatestOnly:
+    """Newest progress/status values waiting to be broadcast (latest wins)."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {"status": None, "progress": None}
+        self.dirty = threading.Event()
+    
+    def store(self, key: str, value):
+        with self._lock:
+            self._values[key] = value
+        self.dirty.set()
+    
+    def take(self) -> bytes:
+        """Encode and clear pending values as SSE frames (status first)."""
+        with self._lock:
+            self.dirty.clear()
+            status, progress = self._values["status"], self._values["progress"]
+            self._values = {"status": None, "progress": None}
+        frame = b''
+        if status is not None:
+            frame += _sse_frame({"type": "status", "value": status.value})
+        if progress is not None:
+            frame += _sse_frame({"type": "progress", "value": progress})
+        return frame
+
+
+_latest = _LatestOnly()
+
+def _init_frame() -> bytes:
+    """Return the SSE init frame for a new stream.
+    
+    Encoded per connection: the status snapshot also carries experiment
+    data and results, which change without a progress/status update.
+    """
+    return _sse_frame({"type": "init", "data": controller.get_status()})
+
+
+def _coalesce_loop():
+    """Publish at most one batch of pending updates per coalesce window."""
+    while True:
+        _latest.dirty.wait()
+        # Let further updates within the window overwrite this one
+        time.sleep(SSE_COALESCE_INTERVAL)
+        frame = _latest.take()
+        # Nobody to deliver to; new streams start from the init frame
+        if frame and sse_clients:
+            sse_buffer.publish(frame)
+
+
+_coalescer: Optional[threading.Thread] = None
+_coalescer_lock = threading.Lock()
+
+
+def _start_coalescer():
+    """Start the coalescing thread on the first SSE stream, not at import."""
+    global _coalescer
+    if _coalescer is None:
+        with _coalescer_lock:
+            if _coalescer is None:
+                _coalescer = threading.Thread(target=_coalesce_loop, name="sse-coalescer", daemon=True)
+                _coalescer.start()
 
 
 def broadcast_progress(progress: float):
     """Broadcast progress to all SSE clients."""
-    message = f'data: {{"type": "progress", "value": {progress}}}\n\n'
-    for client in sse_clients[:]:
-        try:
-            client.put(message)
-        except:
-            pass
+    _latest.store("progress", progress)
 
 
 def broadcast_status(status: ExperimentStatus):
     """Broadcast status to all SSE clients."""
-    message = f'data: {{"type": "status", "value": "{status.value}"}}\n\n'
-    for client in sse_clients[:]:
-        try:
-            client.put(message)
-        except:
-            pass
+    _latest.store("status", status)
 
 
 # Register callbacks
@@ -85,11 +243,22 @@ controller.register_status_callback(broadcast_status)
 
 # ==================== HTML Routes ====================
 
+# Rendered dashboard; the experiment registry is fixed once the controller
+# is built, so the page is rendered on the first request only
+_index_html: Optional[str] = None
+
+
 @app.route("/")
 def index():
     """Main dashboard."""
-    experiments = controller.list_experiments()
-    return render_template("index.html", experiments=experiments)
+    global _index_html
+    if _index_html is None:
+        _index_html = render_template("index.html", experiments=controller.list_experiments())
+    return Response(
+        _index_html,
+        mimetype="text/html",
+        headers={"Cache-Control": "private, max-age=5"}
+    )
 
 
 # ==================== API Routes ====================
@@ -164,34 +333,40 @@ def get_status():
 @app.route("/api/experiments/stream")
 def stream():
     """SSE stream for real-time updates."""
+    if len(sse_clients) >= app.config["SSE_MAX_CLIENTS"]:
+        logger.warning(f"Refusing SSE stream from {request.remote_addr}: "
+                       f"{len(sse_clients)} streams already open")
+        return jsonify({"status": "error", "message": "Too many open update streams"}), 503
+    
+    _start_coalescer()
+    client = _Client(request.remote_addr)
+    
     def event_stream():
-        import queue
-        q = queue.Queue()
-        sse_clients.append(q)
+        sse_clients.add(client)
+        # Take the cursor before the init frame so no update is missed
+        last_seq = sse_buffer.seq
         
         try:
             # Send initial status
-            status = controller.get_status()
-            yield f'data: {{"type": "init", "data": {json.dumps(status)}}}\n\n'
+            yield _init_frame()
             
             while True:
-                try:
-                    msg = q.get(timeout=30)
-                    yield msg
-                except queue.Empty:
+                last_seq, frames, missed = sse_buffer.wait_for(last_seq, timeout=30)
+                if missed:
+                    client.dropped += missed
+                    logger.debug(f"SSE client {client.addr} fell behind: dropped {missed} frames ({client.dropped} total)")
+                if frames:
+                    yield b''.join(frames)
+                else:
                     # Send heartbeat
-                    yield ': heartbeat\n\n'
+                    yield _SSE_HEARTBEAT
         finally:
-            if q in sse_clients:
-                sse_clients.remove(q)
+            sse_clients.discard(client)
     
     return Response(
         event_stream(),
         mimetype='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'X-Accel-Buffering': 'no'
-        }
+        headers=_SSE_HEADERS
     )
 
 
@@ -217,8 +392,19 @@ def main():
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to (default: 0.0.0.0)")
     parser.add_argument("--port", type=int, default=5051, help="Port to bind to (default: 5051)")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument(
+        "--threads", type=int, default=min(32, (os.cpu_count() or 1) * 4),
+        help="Worker threads for ordinary requests when served by waitress "
+             "(default: min(32, 4 x CPUs))"
+    )
+    parser.add_argument(
+        "--sse-clients", type=int, default=app.config["SSE_MAX_CLIENTS"],
+        help="Maximum open live-update (SSE) streams; each holds its own "
+             "thread, added on top of --threads (default: %(default)s)"
+    )
     
     args = parser.parse_args()
+    app.config["SSE_MAX_CLIENTS"] = args.sse_clients
     
     print(f"""
 ==============================================================
@@ -235,7 +421,18 @@ def main():
     """)
     
     logger.info(f"Starting Applet Server on {args.host}:{args.port}")
-    app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
+    if WAITRESS_AVAILABLE and not args.debug:
+        # SSE streams never return their thread, so they get threads of
+        # their own; requests keep args.threads however many streams are open
+        threads = args.threads + args.sse_clients
+        logger.info(f"Serving with waitress ({threads} threads: {args.threads} for requests, "
+                    f"{args.sse_clients} for SSE streams)")
+        serve(app, host=args.host, port=args.port, threads=threads,
+              connection_limit=1000)
+    else:
+        if not args.debug:
+            logger.warning("waitress not installed, using the Flask development server")
+        app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
 
 
 if __name__ == "__main__":
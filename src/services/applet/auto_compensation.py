@@ -22,21 +22,50 @@ PMT Data Collection:
 Usage:
     python -m applet.experiments.auto_compensation
     # or via controller API
+
+    AUTO_COMP_CACHE=record  # store each comp_v scan under data_dir/cache
+    AUTO_COMP_CACHE=replay  # reuse a stored scan, skipping phases 1-3;
+                            # the optimum is reported but not applied
 """
 
+import os
+import gzip
+import json
 import time
-import random
+import hashlib
 import logging
+import subprocess
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 import numpy as np
-from scipy.optimize import fsolve
-import matplotlib.pyplot as plt
 from pathlib import Path
 
+# Optional orjson for the scan cache
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .base import BaseExperiment, ExperimentStatus, ExperimentResult
 
 
+def _git_sha() -> Optional[str]:
+    """Commit of the running code, recorded with cached scans."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, timeout=5
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
 @dataclass
 class CubicFitResult:
     """Result of cubic polynomial fit."""
@@ -49,6 +78,19 @@ class CubicFitResult:
     selected_extrema: Optional[float]
 
 
+# Plots are rendered off the experiment thread, one at a time
+_PLOT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auto_comp_plot")
+
+
+# One row per scan point, in scan order
+SCAN_DTYPE = np.dtype([
+    ("comp_v", "f8"),
+    ("pmt", "f8"),
+    ("idx", "i4"),
+    ("valid", "?"),
+])
+
+
 class AutoCompensationExperiment(BaseExperiment):
     """
     Auto compensation experiment.
@@ -62,7 +104,9 @@ class AutoCompensationExperiment(BaseExperiment):
         self,
         manager_host: str = "localhost",
         manager_port: int = 5557,
-        data_dir: str = "data/experiments"
+        data_dir: str = "data/experiments",
+        seed: Optional[int] = None,
+        plot: bool = False
     ):
         super().__init__(
             name="auto_compensation",
@@ -78,12 +122,43 @@ class AutoCompensationExperiment(BaseExperiment):
         self.comp_v_step = 1.0  # V
         self.comp_h_tolerance = 0.5  # pixels
         self.comp_h_max_iter = 20
+        self.comp_h_gain = 0.01  # V per pixel, first step before the response is measured
+        self.comp_h_ki = 0.2  # integral weight on a persistent residual
+        self.comp_h_max_step = 5.0  # V per iteration
         self.pmt_integration_time = 0.3  # seconds (100ms - matches PMT_beam_finder default)
         self.settling_time = 0.5  # seconds after voltage change
+        self.batch_scan = True  # run the comp_v sweep as one PMT_SCAN request
+        
+        # Scan cache: "record" stores each scan under data_dir/cache,
+        # "replay" reuses a stored scan and skips phases 1-3, "off" disables
+        self.cache_mode = os.environ.get("AUTO_COMP_CACHE", "off").lower()
+        # comp_h a replayed scan must have been taken at; None reads the
+        # live value from the manager
+        self.comp_h_setpoint: Optional[float] = None
+        
+        # Seed for the scan order; recorded so a run can be replayed
+        # (32-bit so it survives JSON round-trips, including in the browser)
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().generate_state(1)[0])
+        
+        # Plot PMT vs comp_v in the background after the fit (opt-in)
+        self.plot = plot
+        self.plot_future: Optional[Future] = None
         
         # Results storage
-        self.scan_data: List[Dict[str, float]] = []
         self.fit_result: Optional[CubicFitResult] = None
+        
+        # Scan buffer, sized in scan_comp_v since the range/step
+        # may be overridden
+        self._scan = np.zeros(0, dtype=SCAN_DTYPE)
+    
+    @property
+    def scan_data(self) -> List[Dict[str, float]]:
+        """Valid scan points as {comp_v, pmt_signal, index} dicts (for JSON export)."""
+        rows = self._scan[self._scan["valid"]]
+        return [
+            {"comp_v": float(v), "pmt_signal": float(p), "index": int(i)}
+            for v, p, i in zip(rows["comp_v"], rows["pmt"], rows["idx"])
+        ]
     
     def get_position(self) -> Optional[Tuple[float, float]]:
         """
@@ -138,7 +213,10 @@ class AutoCompensationExperiment(BaseExperiment):
         """
         Calibrate comp_h to match target_y position.
         
-        Uses simple proportional feedback control.
+        The first step uses a fixed gain; after that the pixel/V response
+        is estimated from the last two samples (secant step) with a small
+        integral term when the last 3 errors keep the same sign. Steps are capped at
+        comp_h_max_step.
         
         Args:
             target_y: Target y position (pixels)
@@ -151,6 +229,10 @@ class AutoCompensationExperiment(BaseExperiment):
         # Get initial comp_h
         current_comp_h = self.get_voltage("comp_h") or 0.0
         
+        prev: Optional[Tuple[float, float]] = None  # (comp_h, y) of last sample
+        slope: Optional[float] = None  # estimated dy/dcomp_h (pixels per V)
+        recent_errors = deque(maxlen=3)
+        
         for iteration in range(self.comp_h_max_iter):
             if self.check_stop():
                 return False
@@ -159,7 +241,7 @@ class AutoCompensationExperiment(BaseExperiment):
             pos = self.get_position()
             if pos is None:
                 self.logger.warning("Cannot get position for comp_h calibration")
-                time.sleep(0.5)
+                self.sleep(0.5)
                 continue
             
             _, current_y = pos
@@ -172,9 +254,27 @@ class AutoCompensationExperiment(BaseExperiment):
                 self.logger.info(f"comp_h calibration converged at {current_comp_h:.3f}V")
                 return True
             
-            # Proportional control with gain
-            gain = 0.01  # V per pixel error
-            adjustment = error * gain
+            # Update the response estimate from the last step
+            if prev is not None:
+                dv = current_comp_h - prev[0]
+                if abs(dv) > 1e-6:
+                    est = (current_y - prev[1]) / dv
+                    if np.isfinite(est) and abs(est) > 1e-6:
+                        slope = est
+            prev = (current_comp_h, current_y)
+            
+            if slope is None:
+                adjustment = error * self.comp_h_gain
+            else:
+                # Integrate only a persistent same-sign residual (secant
+                # steps falling short on a nonlinear response)
+                recent_errors.append(error)
+                integral = 0.0
+                if len(recent_errors) == recent_errors.maxlen and \
+                        all(e * error > 0 for e in recent_errors):
+                    integral = sum(recent_errors)
+                adjustment = (error + self.comp_h_ki * integral) / slope
+            adjustment = max(-self.comp_h_max_step, min(self.comp_h_max_step, adjustment))
             current_comp_h += adjustment
             
             # Clamp to valid range [-50, 50]
@@ -184,11 +284,19 @@ class AutoCompensationExperiment(BaseExperiment):
                 self.logger.error("Failed to set comp_h")
                 return False
             
-            time.sleep(self.settling_time)
+            self.sleep(self.settling_time)
         
         self.logger.warning(f"comp_h calibration did not converge after {self.comp_h_max_iter} iterations")
         return False
     
+    def _comp_v_grid(self) -> np.ndarray:
+        """Ascending comp_v scan points (half-step margin keeps the end point)."""
+        return np.arange(
+            self.comp_v_range[0],
+            self.comp_v_range[1] + 0.5 * self.comp_v_step,
+            self.comp_v_step
+        )
+    
     def scan_comp_v(self) -> List[Dict[str, float]]:
         """
         Scan comp_v and record PMT signal.
@@ -197,43 +305,50 @@ class AutoCompensationExperiment(BaseExperiment):
             List of {comp_v, pmt_signal} dictionaries
         """
         # Generate random sequence of comp_v values
-        num_steps = int((self.comp_v_range[1] - self.comp_v_range[0]) / self.comp_v_step) + 1
-        comp_v_values = [
-            self.comp_v_range[0] + i * self.comp_v_step 
-            for i in range(num_steps)
-        ]
-        random.shuffle(comp_v_values)
+        comp_v_values = self._comp_v_grid()
+        np.random.default_rng(self.seed).shuffle(comp_v_values)
+        self.record_data("seed", self.seed)
         
         self.logger.info(f"Scanning comp_v: {len(comp_v_values)} points in random order")
         
-        scan_data = []
         total_points = len(comp_v_values)
+        self._scan = np.zeros(total_points, dtype=SCAN_DTYPE)
+        
+        # Let the manager run the sweep in a few chunked PMT_SCAN requests if
+        # it can; stop/pause are honoured between chunks
+        batch_counts = None
+        if self.batch_scan and not self.check_stop():
+            batch_counts = self.scan_pmt(
+                "comp_v", comp_v_values.tolist(),
+                settling_ms=self.settling_time * 1000.0,
+                duration_ms=self.pmt_integration_time * 1000.0
+            )
+            if batch_counts is None:
+                self.logger.info("Falling back to point-by-point comp_v scan")
         
         for idx, comp_v in enumerate(comp_v_values):
-            if self.check_stop():
-                break
-            self.pause_point()
-            
-            self.logger.info(f"Scanning {idx+1}/{total_points}: comp_v={comp_v:.1f}V")
-            
-            # Set comp_v
-            if not self.set_voltage("comp_v", comp_v):
-                self.logger.error(f"Failed to set comp_v={comp_v}")
-                continue
-            
-            # Wait for settling
-            time.sleep(self.settling_time)
-            
-            # Measure PMT
-            pmt_signal = self.get_pmt_signal(self.pmt_integration_time)
+            if batch_counts is not None:
+                if idx >= len(batch_counts):
+                    break  # stopped part-way through the batched sweep
+                counts = batch_counts[idx]
+                pmt_signal = None if counts is None else float(counts)
+            else:
+                if self.check_stop():
+                    break
+                self.pause_point()
+                
+                self.logger.info(f"Scanning {idx+1}/{total_points}: comp_v={comp_v:.1f}V")
+                
+                # Set comp_v, settle and measure PMT in one request
+                counts = self.set_and_measure(
+                    {"comp_v": float(comp_v)},
+                    settle_ms=self.settling_time * 1000.0,
+                    gate_ms=self.pmt_integration_time * 1000.0
+                )
+                pmt_signal = None if counts is None else float(counts)
             
             if pmt_signal is not None:
-                point = {
-                    "comp_v": comp_v,
-                    "pmt_signal": pmt_signal,
-                    "index": idx
-                }
-                scan_data.append(point)
+                self._scan[idx] = (comp_v, pmt_signal, idx, True)
                 self.logger.debug(f"  PMT signal: {pmt_signal:.1f}")
             else:
                 self.logger.warning(f"  Failed to get PMT signal at comp_v={comp_v}")
@@ -242,38 +357,60 @@ class AutoCompensationExperiment(BaseExperiment):
             progress = 30 + (idx / total_points) * 50
             self.set_progress(progress)
         
-        return scan_data
+        return self.scan_data
     
-    def fit_cubic(self, data: List[Dict[str, float]]) -> Optional[CubicFitResult]:
+    def fit_cubic(self, data: Optional[List[Dict[str, float]]] = None) -> Optional[CubicFitResult]:
         """
         Fit cubic polynomial to PMT vs comp_v data.
         
         PMT = a*comp_v³ + b*comp_v² + c*comp_v + d
         
         Args:
-            data: List of {comp_v, pmt_signal} points
+            data: List of {comp_v, pmt_signal} points. If None, the
+                  arrays filled by the last scan_comp_v() are used.
         
         Returns:
             CubicFitResult with coefficients and extremas
         """
-        if len(data) < 4:
-            self.logger.error(f"Not enough data points for cubic fit (need 4, have {len(data)})")
-            return None
-        
         # Extract arrays
-        x = np.array([d["comp_v"] for d in data])
-        y = np.array([d["pmt_signal"] for d in data])
+        if data is None:
+            rows = self._scan[self._scan["valid"]]
+            x = rows["comp_v"]
+            y = rows["pmt"]
+        else:
+            x = np.array([d["comp_v"] for d in data])
+            y = np.array([d["pmt_signal"] for d in data])
+        
+        if len(x) < 4:
+            self.logger.error(f"Not enough data points for cubic fit (need 4, have {len(x)})")
+            return None
         
         # Fit cubic: ax³ + bx² + cx + d
-        coeffs = np.polyfit(x, y, 3)
-        a, b, c, d = coeffs
+        # Solve the 4x4 normal equations M·k = T directly, with
+        # M[i, j] = Σt^(i+j) and T[i] = Σt^i·y. t = x - mean(x) keeps
+        # the power sums well conditioned (x^6 ~ 1e10 at 50 V).
+        n = len(x)
+        m = x.mean()
+        t = x - m
+        powers = np.vander(t, 7, increasing=True)  # t^0 .. t^6
+        S = powers.sum(axis=0)
+        T = powers[:, :4].T @ y
+        M = S[np.add.outer(np.arange(4), np.arange(4))]
+        k0, k1, k2, k3 = np.linalg.solve(M, T)
+        
+        # Expand k0 + k1·t + k2·t² + k3·t³ back into powers of x
+        a = k3
+        b = k2 - 3 * k3 * m
+        c = k1 - 2 * k2 * m + 3 * k3 * m**2
+        d = k0 - k1 * m + k2 * m**2 - k3 * m**3
         
         self.logger.info(f"Cubic fit: a={a:.6f}, b={b:.6f}, c={c:.6f}, d={d:.6f}")
         
-        # Calculate R²
-        y_pred = a * x**3 + b * x**2 + c * x + d
-        ss_res = np.sum((y - y_pred) ** 2)
-        ss_tot = np.sum((y - np.mean(y)) ** 2)
+        # Calculate R² without re-evaluating the fit:
+        # SS_res = Σy² - k·T, SS_tot = Σy² - (Σy)²/n
+        sum_y2 = y @ y
+        ss_res = max(sum_y2 - np.dot((k0, k1, k2, k3), T), 0.0)  # clamp rounding
+        ss_tot = sum_y2 - y.sum()**2 / n
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
         
         self.logger.info(f"R² = {r_squared:.4f}")
@@ -287,7 +424,7 @@ class AutoCompensationExperiment(BaseExperiment):
             sqrt_disc = np.sqrt(discriminant)
             x1 = (-2*b + sqrt_disc) / (6*a)
             x2 = (-2*b - sqrt_disc) / (6*a)
-            extremas = sorted([x1, x2])
+            extremas = [x2, x1] if x1 > x2 else [x1, x2]
             self.logger.info(f"Found extremas at comp_v = {extremas[0]:.2f}, {extremas[1]:.2f}")
         else:
             self.logger.warning("No real extremas found (discriminant < 0)")
@@ -316,18 +453,36 @@ class AutoCompensationExperiment(BaseExperiment):
             selected_extrema=selected
         )
     
-    def plot_results(self, data: List[Dict[str, float]], fit: CubicFitResult) -> str:
+    def plot_path(self) -> Path:
+        """Path the next PMT vs comp_v plot is saved to."""
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        return self.data_dir / f"auto_compensation_{timestamp}.png"
+    
+    def plot_results(self, data: List[Dict[str, float]], fit: CubicFitResult,
+                     plot_path: Optional[Path] = None) -> str:
         """
         Create and save plot of PMT vs comp_v with fit.
         
         Args:
             data: Scan data
             fit: Fit result
+            plot_path: Output PNG path (default: plot_path())
         
         Returns:
             Path to saved plot
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        if plot_path is None:
+            plot_path = self.plot_path()
+        
+        # Imported here so runs that never plot don't pay for matplotlib.
+        # Figure + Agg canvas avoids pyplot's global figure manager and
+        # backend selection, and is safe off the main thread.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=(10, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
         
         # Sort data by comp_v for plotting
         sorted_data = sorted(data, key=lambda d: d["comp_v"])
@@ -357,14 +512,180 @@ class AutoCompensationExperiment(BaseExperiment):
         ax.grid(True, alpha=0.3)
         
         # Save plot
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        plot_path = self.data_dir / f"auto_compensation_{timestamp}.png"
-        plt.savefig(plot_path, dpi=150, bbox_inches='tight')
-        plt.close()
+        fig.savefig(plot_path, dpi=150, bbox_inches='tight')
         
         self.logger.info(f"Plot saved to {plot_path}")
         return str(plot_path)
     
+    # ==================== Scan Cache ====================
+    
+    def _scan_cache_path(self, comp_h: float) -> Path:
+        """
+        Cache file for the current scan settings.
+        
+        Keyed by the inputs that determine the scan: comp_v points,
+        settling/integration times, both RF levels and the comp_h the
+        scan was taken at (to the mV).
+        """
+        key = {
+            "comp_h": round(float(comp_h), 3),
+            "comp_v_values": self._comp_v_grid().tolist(),
+            "settling_time": self.settling_time,
+            "pmt_integration_time": self.pmt_integration_time,
+            "u_rf_high": self.u_rf_high,
+            "u_rf_low": self.u_rf_low,
+        }
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return self.data_dir / "cache" / f"{digest}.json.gz"
+    
+    def save_scan_cache(self) -> Optional[str]:
+        """
+        Store the last scan (gzip JSON) for later replay.
+        
+        Returns:
+            Path to the cache file or None on failure
+        """
+        path = self._scan_cache_path(self.get_data("comp_h_final", 0.0))
+        payload = {
+            "scan_data": self.scan_data,
+            "meta": {
+                "git_sha": _git_sha(),
+                "timestamp": datetime.now().isoformat(),
+                "seed": self.seed,
+                "settling": self.settling_time,
+                "integration": self.pmt_integration_time,
+                "u_rf_low": self.u_rf_low,
+                "comp_h_final": self.get_data("comp_h_final"),
+            }
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if ORJSON_AVAILABLE:
+                raw = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                raw = json.dumps(payload, default=float).encode()
+            with gzip.open(path, "wb") as f:
+                f.write(raw)
+        except Exception as e:
+            self.logger.warning(f"Failed to write scan cache: {e}")
+            return None
+        
+        self.logger.info(f"Scan cached to {path}")
+        return str(path)
+    
+    def replay_scan_cache(self) -> bool:
+        """
+        Load a cached scan in place of phases 1-3.
+        
+        Returns:
+            True if a cached scan was found and loaded
+        """
+        comp_h = self.comp_h_setpoint
+        if comp_h is None:
+            comp_h = self.get_voltage("comp_h")
+        if comp_h is None:
+            self.logger.info("comp_h unknown, cannot match a cached scan; measuring")
+            return False
+        
+        path = self._scan_cache_path(comp_h)
+        try:
+            with gzip.open(path, "rb") as f:
+                raw = f.read()
+            payload = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except FileNotFoundError:
+            self.logger.info("No cached scan for these settings, measuring")
+            return False
+        except Exception as e:
+            self.logger.warning(f"Failed to read scan cache {path}: {e}")
+            return False
+        
+        meta = payload.get("meta", {})
+        points = payload["scan_data"]
+        self._scan = np.zeros(len(points), dtype=SCAN_DTYPE)
+        for row, d in enumerate(points):
+            self._scan[row] = (d["comp_v"], d["pmt_signal"], d["index"], True)
+        
+        self.record_data("comp_h_final", meta.get("comp_h_final") or 0.0)
+        self.record_data("seed", meta.get("seed"))
+        self.record_data("scan_data", points)
+        self.record_data("scan_cache", {"path": str(path), **meta})
+        self.logger.info(f"Replaying cached scan from {path} ({meta.get('timestamp')})")
+        return True
+    
+    def _on_plot_done(self, future: Future):
+        """Log a failed background plot."""
+        try:
+            future.result()
+        except Exception as e:
+            self.logger.error(f"Plot failed: {e}")
+    
+    def _acquire_scan(self) -> Optional[ExperimentResult]:
+        """
+        Run phases 1-3 on hardware: reference position, comp_h calibration
+        and the comp_v PMT scan.
+        
+        Returns:
+            ExperimentResult describing the failure, or None on success
+        """
+        # Phase 1: Record reference position at u_rf = 200V
+        self.set_progress(5)
+        self.logger.info("PHASE 1: Setting u_rf = 200V")
+        
+        if not self.set_voltage("u_rf", self.u_rf_high):
+            return ExperimentResult(
+                success=False,
+                error="Failed to set u_rf to 200V"
+            )
+        
+        self.sleep(self.settling_time * 2)  # Extra settling for RF change
+        
+        pos = self.get_position()
+        if pos is None:
+            return ExperimentResult(
+                success=False,
+                error="Failed to get position at u_rf=200V"
+            )
+        
+        _, ref_y = pos
+        self.record_data("reference_y", ref_y)
+        self.record_data("u_rf_high", self.u_rf_high)
+        self.logger.info(f"Reference position y = {ref_y:.2f} pixels")
+        
+        # Phase 2: Set u_rf = 100V and calibrate comp_h
+        self.set_progress(10)
+        self.logger.info("PHASE 2: Setting u_rf = 100V and calibrating comp_h")
+        
+        if not self.set_voltage("u_rf", self.u_rf_low):
+            return ExperimentResult(
+                success=False,
+                error="Failed to set u_rf to 100V"
+            )
+        
+        self.sleep(self.settling_time * 2)
+        
+        if not self.calibrate_comp_h(ref_y):
+            self.logger.warning("comp_h calibration did not converge, continuing anyway")
+        
+        # Record final comp_h
+        final_comp_h = self.get_voltage("comp_h") or 0.0
+        self.record_data("comp_h_final", final_comp_h)
+        self.logger.info(f"comp_h = {final_comp_h:.3f}V")
+        
+        # Phase 3: Scan comp_v and record PMT
+        self.set_progress(30)
+        self.logger.info("PHASE 3: Scanning comp_v")
+        
+        scan_data = self.scan_comp_v()
+        self.record_data("scan_data", scan_data)
+        
+        if len(scan_data) < 4:
+            return ExperimentResult(
+                success=False,
+                error=f"Insufficient scan data ({len(scan_data)} points, need >= 4)"
+            )
+        
+        return None
+    
     def run(self) -> ExperimentResult:
         """
         Execute auto compensation experiment.
@@ -377,69 +698,24 @@ class AutoCompensationExperiment(BaseExperiment):
         self.logger.info("="*50)
         
         try:
-            # Phase 1: Record reference position at u_rf = 200V
             self.set_status(ExperimentStatus.RUNNING)
-            self.set_progress(5)
-            self.logger.info("PHASE 1: Setting u_rf = 200V")
-            
-            if not self.set_voltage("u_rf", self.u_rf_high):
-                return ExperimentResult(
-                    success=False,
-                    error="Failed to set u_rf to 200V"
-                )
-            
-            time.sleep(self.settling_time * 2)  # Extra settling for RF change
-            
-            pos = self.get_position()
-            if pos is None:
-                return ExperimentResult(
-                    success=False,
-                    error="Failed to get position at u_rf=200V"
-                )
-            
-            _, ref_y = pos
-            self.record_data("reference_y", ref_y)
-            self.record_data("u_rf_high", self.u_rf_high)
-            self.logger.info(f"Reference position y = {ref_y:.2f} pixels")
-            
-            # Phase 2: Set u_rf = 100V and calibrate comp_h
-            self.set_progress(10)
-            self.logger.info("PHASE 2: Setting u_rf = 100V and calibrating comp_h")
             
-            if not self.set_voltage("u_rf", self.u_rf_low):
-                return ExperimentResult(
-                    success=False,
-                    error="Failed to set u_rf to 100V"
-                )
-            
-            time.sleep(self.settling_time * 2)
-            
-            if not self.calibrate_comp_h(ref_y):
-                self.logger.warning("comp_h calibration did not converge, continuing anyway")
-            
-            # Record final comp_h
-            final_comp_h = self.get_voltage("comp_h") or 0.0
-            self.record_data("comp_h_final", final_comp_h)
-            self.logger.info(f"comp_h = {final_comp_h:.3f}V")
-            
-            # Phase 3: Scan comp_v and record PMT
-            self.set_progress(30)
-            self.logger.info("PHASE 3: Scanning comp_v")
-            
-            self.scan_data = self.scan_comp_v()
-            self.record_data("scan_data", self.scan_data)
+            # Phases 1-3 are skipped when a cached scan can be replayed
+            replayed = self.cache_mode == "replay" and self.replay_scan_cache()
+            if not replayed:
+                error = self._acquire_scan()
+                if error is not None:
+                    return error
+                if self.cache_mode in ("record", "replay"):
+                    self.save_scan_cache()
             
-            if len(self.scan_data) < 4:
-                return ExperimentResult(
-                    success=False,
-                    error=f"Insufficient scan data ({len(self.scan_data)} points, need >= 4)"
-                )
+            final_comp_h = self.get_data("comp_h_final", 0.0)
             
             # Phase 4: Fit cubic and find optimum
             self.set_progress(80)
             self.logger.info("PHASE 4: Fitting cubic and finding optimum")
             
-            self.fit_result = self.fit_cubic(self.scan_data)
+            self.fit_result = self.fit_cubic()
             
             if self.fit_result is None:
                 return ExperimentResult(
@@ -457,9 +733,15 @@ class AutoCompensationExperiment(BaseExperiment):
             self.record_data("extremas", self.fit_result.extremas)
             self.record_data("selected_extrema", self.fit_result.selected_extrema)
             
-            # Create plot
-            plot_path = self.plot_results(self.scan_data, self.fit_result)
-            self.record_data("plot_path", plot_path)
+            # Plot in the background; the path is recorded now so it is
+            # part of the result even while the PNG is still being written
+            if self.plot:
+                plot_path = self.plot_path()
+                self.record_data("plot_path", str(plot_path))
+                self.plot_future = _PLOT_EXECUTOR.submit(
+                    self.plot_results, self.scan_data, self.fit_result, plot_path
+                )
+                self.plot_future.add_done_callback(self._on_plot_done)
             
             # Phase 5: Set optimal comp_v
             self.set_progress(95)
@@ -468,6 +750,17 @@ class AutoCompensationExperiment(BaseExperiment):
                 optimal_v = self.fit_result.selected_extrema
                 
                 if 0 <= optimal_v <= 50:
+                    if replayed:
+                        # Offline replay: report the optimum, leave the trap alone
+                        self.record_data("optimal_comp_v", optimal_v)
+                        self.record_data("optimization_success", True)
+                        self.set_progress(100)
+                        return ExperimentResult(
+                            success=True,
+                            data=self.data,
+                            message=f"Replayed cached scan. Optimal comp_v = {optimal_v:.3f}V (not applied), comp_h = {final_comp_h:.3f}V"
+                        )
+                    
                     self.logger.info(f"Setting optimal comp_v = {optimal_v:.3f}V")
                     
                     if not self.set_voltage("comp_v", optimal_v):
@@ -480,7 +773,7 @@ class AutoCompensationExperiment(BaseExperiment):
                     self.record_data("optimization_success", True)
                     
                     # Wait and verify
-                    time.sleep(self.settling_time)
+                    self.sleep(self.settling_time)
                     final_pmt = self.get_pmt_signal(self.pmt_integration_time)
                     self.record_data("final_pmt_signal", final_pmt)
                     
@@ -521,6 +814,8 @@ def main():
     parser.add_argument("--port", type=int, default=5557, help="Manager port")
     parser.add_argument("--data-dir", default="data/experiments", help="Data directory")
     parser.add_argument("--blocking", action="store_true", help="Run blocking (not threaded)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the comp_v scan order")
+    parser.add_argument("--plot", action="store_true", help="Save a PMT vs comp_v plot")
     
     args = parser.parse_args()
     
@@ -534,7 +829,9 @@ def main():
     exp = AutoCompensationExperiment(
         manager_host=args.host,
         manager_port=args.port,
-        data_dir=args.data_dir
+        data_dir=args.data_dir,
+        seed=args.seed,
+        plot=args.plot
     )
     
     print("="*60)
@@ -562,6 +859,9 @@ def main():
     else:
         result = exp.result
     
+    if exp.plot_future is not None:
+        exp.plot_future.result()
+    
     # Print results
     print("\n" + "="*60)
     if result and result.success:
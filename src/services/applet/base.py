@@ -11,16 +11,61 @@ Provides common functionality for:
 import threading
 import time
 import logging
+import itertools
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from datetime import datetime
 import json
 from pathlib import Path
 
 import zmq
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Writes end-of-run data files off the experiment thread
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exp-writer")
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if ORJSON_AVAILABLE else 0
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data for disk (save_data, record journal) as JSON bytes.
+    
+    Uses orjson when available and the stdlib encoder otherwise, or when
+    orjson rejects a value (e.g. ints beyond 64 bits). Values neither
+    encoder knows are written as str.
+    """
+    if ORJSON_AVAILABLE:
+        option = (_ORJSON_OPTIONS | orjson.OPT_INDENT_2) if indent else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=str, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode()
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    """Encode a manager request (JSON, as the manager's recv_json expects)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(message).encode()
+
+
+_decode = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class ExperimentStatus(Enum):
     """Experiment execution states."""
@@ -40,6 +85,21 @@ class ExperimentResult:
     message: str = ""
     error: Optional[str] = None
     timestamp: float = field(default_factory=time.time)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        The result fields as a dict, like dataclasses.asdict(self).
+        
+        Shallow: data is shared rather than deep-copied, since status is
+        polled repeatedly and only serialized from here.
+        """
+        return {
+            "success": self.success,
+            "data": self.data,
+            "message": self.message,
+            "error": self.error,
+            "timestamp": self.timestamp
+        }
 
 
 class BaseExperiment(ABC):
@@ -64,6 +124,14 @@ class BaseExperiment(ABC):
                 return ExperimentResult(success=True, data=self.data)
     """
     
+    # Progress callback rate limit (percent, seconds)
+    PROGRESS_MIN_STEP = 0.5
+    PROGRESS_MIN_INTERVAL = 0.05
+    
+    # Time budget of one PMT_SCAN request (ms); must not exceed the
+    # manager's PMT_SCAN_MAX_MS
+    PMT_SCAN_CHUNK_MS = 2000.0
+    
     def __init__(
         self,
         name: str,
@@ -72,54 +140,72 @@ class BaseExperiment(ABC):
         data_dir: str = "data/experiments"
     ):
         self.name = name
+        self._source = f"EXPERIMENT_{name.upper()}"  # "source" field of manager requests
         self.manager_host = manager_host
         self.manager_port = manager_port
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Status and progress
+        # Status and progress: single attribute reads/writes are atomic
+        # under the GIL, so these are read from other threads without a lock
         self._status = ExperimentStatus.IDLE
         self._progress = 0.0  # 0-100
-        self._status_lock = threading.RLock()
+        # Last progress value handed to callbacks, and when (monotonic)
+        self._last_bcast = 0.0
+        self._last_bcast_ts = 0.0
         
-        # Data storage
-        self.data: Dict[str, Any] = {}
+        # Data storage: record_data only appends to _records (deque.append
+        # is atomic, so no lock); readers fold pending records into _data
+        self._records: deque = deque()
+        self._data: Dict[str, Any] = {}
         self._data_lock = threading.RLock()
         
+        # Optional append-only JSONL journal of every record_data call,
+        # flushed as records arrive so a crashed run keeps what it recorded.
+        # It is an extra, durable copy: data still holds the latest value per
+        # key, but records are folded in directly instead of queueing up in
+        # _records, so a long journaled run keeps O(keys) in memory.
+        self.stream_records = False
+        self._record_stream = None
+        
         # Threading
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()
+        # Notified whenever stop/pause/resume is requested, so sleep() and
+        # pause_point() block until something changes instead of polling
+        self._control = threading.Condition()
         
         # ZMQ
-        self._zmq_context: Optional[zmq.Context] = None
-        self._zmq_socket: Optional[zmq.Socket] = None
-        self._zmq_lock = threading.Lock()
+        self._zmq_tls = threading.local()  # one socket per calling thread
+        self._zmq_sockets: List[zmq.Socket] = []  # all of them, for cleanup()
+        self._zmq_lock = threading.Lock()  # socket creation/cleanup only
+        self._corr_ids = itertools.count()  # request correlation IDs
         
-        # Callbacks
-        self._progress_callbacks: List[Callable[[float], None]] = []
-        self._status_callbacks: List[Callable[[ExperimentStatus], None]] = []
+        # Callbacks: immutable tuples, replaced (not mutated) on add so
+        # notifiers can iterate them from any thread without a lock
+        self._progress_callbacks: Tuple[Callable[[float], None], ...] = ()
+        self._status_callbacks: Tuple[Callable[[ExperimentStatus], None], ...] = ()
         
         # Logger
         self.logger = logging.getLogger(f"experiment.{name}")
         
         # Result
         self._result: Optional[ExperimentResult] = None
+        self.save_future: Optional[Future] = None  # end-of-run save on _WRITER
     
     # ==================== Status & Progress ====================
     
     @property
     def status(self) -> ExperimentStatus:
         """Get current experiment status."""
-        with self._status_lock:
-            return self._status
+        return self._status
     
     def set_status(self, status: ExperimentStatus):
         """Set experiment status and notify callbacks."""
-        with self._status_lock:
-            old_status = self._status
-            self._status = status
-            self.logger.info(f"Status: {old_status.value} -> {status.value}")
+        old_status = self._status
+        self._status = status
+        self.logger.info(f"Status: {old_status.value} -> {status.value}")
         
         for callback in self._status_callbacks:
             try:
@@ -130,14 +216,26 @@ class BaseExperiment(ABC):
     @property
     def progress(self) -> float:
         """Get current progress (0-100)."""
-        with self._status_lock:
-            return self._progress
+        return self._progress
     
     def set_progress(self, progress: float):
-        """Set progress (0-100) and notify callbacks."""
+        """
+        Set progress (0-100) and notify callbacks.
+        
+        Callbacks are skipped for changes under PROGRESS_MIN_STEP that come
+        within PROGRESS_MIN_INTERVAL of the last notification; 0 and 100
+        are always sent.
+        """
         progress = max(0.0, min(100.0, progress))
-        with self._status_lock:
-            self._progress = progress
+        self._progress = progress
+        
+        now = time.monotonic()
+        if (progress not in (0.0, 100.0)
+                and abs(progress - self._last_bcast) < self.PROGRESS_MIN_STEP
+                and now - self._last_bcast_ts < self.PROGRESS_MIN_INTERVAL):
+            return
+        self._last_bcast = progress
+        self._last_bcast_ts = now
         
         for callback in self._progress_callbacks:
             try:
@@ -147,60 +245,143 @@ class BaseExperiment(ABC):
     
     def add_progress_callback(self, callback: Callable[[float], None]):
         """Add callback for progress updates."""
-        self._progress_callbacks.append(callback)
+        self._progress_callbacks = self._progress_callbacks + (callback,)
     
     def add_status_callback(self, callback: Callable[[ExperimentStatus], None]):
         """Add callback for status updates."""
-        self._status_callbacks.append(callback)
+        self._status_callbacks = self._status_callbacks + (callback,)
     
     # ==================== Data Management ====================
     
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Recorded data (latest value per key)."""
+        with self._data_lock:
+            records = self._records
+            while records:
+                key, value = records.popleft()
+                self._data[key] = value
+            return self._data
+    
+    @data.setter
+    def data(self, value: Dict[str, Any]):
+        with self._data_lock:
+            self._records.clear()
+            self._data = dict(value)
+    
     def record_data(self, key: str, value: Any):
         """Record experimental data."""
+        if self._record_stream is None:
+            self._records.append((key, value))
+        else:
+            self._journal_records({key: value})
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Recorded data: {key} = {value}")
+    
+    def record_data_bulk(self, record: Dict[str, Any]):
+        """Record several data keys at once (same effect as record_data per item)."""
+        if self._record_stream is None:
+            self._records.extend(record.items())
+        else:
+            self._journal_records(record)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Recorded data: {', '.join(record)}")
+    
+    def _journal_records(self, record: Dict[str, Any]):
+        """Append records to the JSONL journal and fold them straight into data."""
+        t = time.time()
+        with self._data_lock:
+            if self._record_stream is not None:
+                self._record_stream.write(b"".join(
+                    _dumps({"t": t, "key": key, "value": value}) + b"\n"
+                    for key, value in record.items()
+                ))
+                # One write per call reaches the OS, so a crash of this
+                # process loses nothing already recorded
+                self._record_stream.flush()
+            # Not queued in _records: a long journaled run keeps one value per key
+            self.data.update(record)
+    
+    def _open_record_stream(self):
+        """Start a new JSONL journal for this run (flushed after every record call)."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = self.data_dir / f"{self.name}_{timestamp}.jsonl"
         with self._data_lock:
-            self.data[key] = value
-        self.logger.debug(f"Recorded data: {key} = {value}")
+            self._record_stream = open(path, 'ab')
+        self.logger.info(f"Streaming records to {path}")
+    
+    def _close_record_stream(self):
+        """Flush and close the JSONL journal, if any."""
+        with self._data_lock:
+            if self._record_stream is not None:
+                self._record_stream.close()
+                self._record_stream = None
     
     def get_data(self, key: str, default: Any = None) -> Any:
         """Get recorded data."""
-        with self._data_lock:
-            return self.data.get(key, default)
+        return self.data.get(key, default)
     
     def save_data(self, filename: Optional[str] = None):
         """Save data to JSON file."""
+        filepath, data_to_save = self._snapshot_data(filename)
+        self._close_record_stream()
+        return self._write_data(filepath, data_to_save)
+    
+    def _snapshot_data(self, filename: Optional[str] = None) -> Tuple[Path, Dict[str, Any]]:
+        """Build the save_data file path and contents from the current data."""
+        now = datetime.now()
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{self.name}_{timestamp}.json"
-        
-        filepath = self.data_dir / filename
+            filename = f"{self.name}_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         with self._data_lock:
             data_to_save = {
                 "experiment_name": self.name,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "status": self._status.value,
-                "data": self.data
+                "data": dict(self.data)
             }
-        
-        with open(filepath, 'w') as f:
-            json.dump(data_to_save, f, indent=2, default=str)
-        
+        return self.data_dir / filename, data_to_save
+    
+    def _write_data(self, filepath: Path, data_to_save: Dict[str, Any]) -> Path:
+        """Serialize and write a _snapshot_data() result."""
+        filepath.write_bytes(_dumps(data_to_save, indent=True))
         self.logger.info(f"Data saved to {filepath}")
         return filepath
     
+    def _on_save_done(self, future: Future):
+        """Log a failed background save."""
+        try:
+            future.result()
+        except Exception as e:
+            self.logger.error(f"Saving data failed: {e}")
+    
     # ==================== ZMQ Communication ====================
     
     def _get_socket(self) -> zmq.Socket:
-        """Get or create ZMQ socket."""
+        """
+        Get or create this thread's DEALER socket to the ControlManager.
+        
+        Sockets are not thread-safe, so each calling thread gets its own
+        and requests need no lock. Requests are framed as
+        [correlation id, b"", json]; the manager's REP socket echoes the
+        frames before the delimiter, so replies can be matched to requests
+        with several in flight.
+        """
+        sock = getattr(self._zmq_tls, "sock", None)
+        if sock is not None and not sock.closed:
+            return sock
+        
         with self._zmq_lock:
-            if self._zmq_socket is None:
-                self._zmq_context = zmq.Context()
-                self._zmq_socket = self._zmq_context.socket(zmq.REQ)
-                self._zmq_socket.connect(f"tcp://{self.manager_host}:{self.manager_port}")
-                self._zmq_socket.setsockopt(zmq.RCVTIMEO, 10000)  # 10 second timeout
-                self._zmq_socket.setsockopt(zmq.LINGER, 0)
-                self.logger.info(f"ZMQ connected to {self.manager_host}:{self.manager_port}")
-            return self._zmq_socket
+            # Process-wide context: experiments share its IO thread
+            sock = zmq.Context.instance().socket(zmq.DEALER)
+            sock.setsockopt(zmq.LINGER, 0)
+            sock.setsockopt(zmq.SNDHWM, 1000)
+            sock.setsockopt(zmq.RCVHWM, 1000)
+            sock.connect(f"tcp://{self.manager_host}:{self.manager_port}")
+            self._zmq_sockets.append(sock)
+        self._zmq_tls.sock = sock
+        self.logger.info(f"ZMQ connected to {self.manager_host}:{self.manager_port}")
+        return sock
     
     def send_to_manager(self, message: Dict[str, Any], timeout_ms: int = 10000) -> Dict[str, Any]:
         """
@@ -213,27 +394,90 @@ class BaseExperiment(ABC):
         Returns:
             Response dictionary
         """
+        return self.send_many([message], timeout_ms=timeout_ms)[0]
+    
+    def send_many(self, messages: List[Dict[str, Any]], timeout_ms: int = 10000) -> List[Dict[str, Any]]:
+        """
+        Send several requests to ControlManager back to back.
+        
+        All requests are sent before any reply is awaited, so a batch costs
+        one network round-trip plus the manager's processing time instead
+        of one round-trip per request. The manager still handles them in
+        order.
+
+        No experiment batches requests yet: send_to_manager() goes through
+        here with a single message. What this buys today is the correlation
+        id, which lets a late reply to a timed-out request be discarded
+        instead of being read as the answer to the next one.
+
+        Args:
+            messages: Request dictionaries
+            timeout_ms: Timeout for the whole batch in milliseconds
+        
+        Returns:
+            Response dictionaries in request order (an error response for
+            any request not answered in time)
+        """
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        pending: Dict[bytes, int] = {}
         try:
             sock = self._get_socket()
-            sock.setsockopt(zmq.RCVTIMEO, timeout_ms)
-            sock.send_json(message)
-            return sock.recv_json()
-        except zmq.Again:
-            self.logger.error("Manager request timeout")
-            return {"status": "error", "message": "Timeout"}
+            for idx, message in enumerate(messages):
+                corr_id = next(self._corr_ids).to_bytes(8, "big")
+                pending[corr_id] = idx
+                sock.send_multipart([corr_id, b"", _encode(message)])
+            
+            deadline = time.monotonic() + timeout_ms / 1000.0
+            while pending:
+                remaining_ms = (deadline - time.monotonic()) * 1000.0
+                if remaining_ms <= 0 or not sock.poll(remaining_ms):
+                    break
+                frames = sock.recv_multipart()
+                idx = pending.pop(frames[0], None)
+                if idx is None:
+                    continue  # late reply to a request that already timed out
+                responses[idx] = _decode(frames[-1])
         except Exception as e:
             self.logger.error(f"Manager request failed: {e}")
-            return {"status": "error", "message": str(e)}
+            return [
+                r if r is not None else {"status": "error", "message": str(e)}
+                for r in responses
+            ]
+        
+        if pending:
+            self.logger.error("Manager request timeout")
+        return [
+            r if r is not None else {"status": "error", "message": "Timeout"}
+            for r in responses
+        ]
     
     # ==================== Hardware Control Helpers ====================
     
+    def _request_template(self, action: str) -> Dict[str, Any]:
+        """
+        Get this thread's reusable request dict for a hot-path action.
+        
+        Callers overwrite the variable fields and send it; the dict is
+        encoded before send_to_manager returns, so reusing it on the next
+        call is safe. Templates are per thread because sockets are.
+        """
+        templates = getattr(self._zmq_tls, "templates", None)
+        if templates is None:
+            templates = self._zmq_tls.templates = {}
+        message = templates.get(action)
+        if message is None:
+            message = templates[action] = {"action": action, "source": self._source}
+        return message
+    
     def set_voltage(self, device: str, value: float) -> bool:
         """Set a voltage device."""
-        response = self.send_to_manager({
-            "action": "SET",
-            "source": f"EXPERIMENT_{self.name.upper()}",
-            "params": {device: value}
-        })
+        message = self._request_template("SET")
+        params = message.get("params")
+        if params is None:
+            params = message["params"] = {}
+        params.clear()
+        params[device] = value
+        response = self.send_to_manager(message)
         success = response.get("status") == "success"
         if success:
             self.logger.debug(f"Set {device} = {value}")
@@ -245,7 +489,7 @@ class BaseExperiment(ABC):
         """Get current voltage reading."""
         response = self.send_to_manager({
             "action": "GET",
-            "source": f"EXPERIMENT_{self.name.upper()}"
+            "source": self._source
         })
         if response.get("status") == "success":
             params = response.get("params", {})
@@ -277,11 +521,9 @@ class BaseExperiment(ABC):
         """
         self.logger.debug(f"Requesting PMT measurement: duration={duration_ms}ms")
         
-        response = self.send_to_manager({
-            "action": "PMT_MEASURE",
-            "source": f"EXPERIMENT_{self.name.upper()}",
-            "duration_ms": duration_ms
-        }, timeout_ms=timeout_ms)
+        message = self._request_template("PMT_MEASURE")
+        message["duration_ms"] = duration_ms
+        response = self.send_to_manager(message, timeout_ms=timeout_ms)
         
         if response.get("status") == "success":
             counts = response.get("counts")
@@ -292,11 +534,99 @@ class BaseExperiment(ABC):
         self.logger.warning(f"PMT measurement failed: {response.get('message', 'Unknown error')}")
         return None
     
+    def scan_pmt(self, device: str, values: List[float], settling_ms: float,
+                 duration_ms: float = 100.0) -> Optional[List[Optional[int]]]:
+        """
+        Step a device through values and measure PMT at each, in few requests.
+        
+        The manager runs the SET -> settle -> PMT_MEASURE loop itself
+        (PMT_SCAN action). The sweep is sent in chunks of at most
+        PMT_SCAN_CHUNK_MS so the manager stays responsive, with stop/pause
+        checked between chunks.
+        
+        Args:
+            device: Parameter to scan (e.g. "comp_v")
+            values: Values to set, in order
+            settling_ms: Wait after each set before measuring
+            duration_ms: PMT gate duration per point
+        
+        Returns:
+            Counts per value (None where that point failed; shorter than
+            values if the experiment was stopped), or None if the manager
+            does not support PMT_SCAN or a request failed
+        """
+        values = list(values)
+        point_ms = settling_ms + duration_ms
+        chunk = max(1, int(self.PMT_SCAN_CHUNK_MS // point_ms)) if point_ms > 0 else max(1, len(values))
+        
+        counts: List[Optional[int]] = []
+        for start in range(0, len(values), chunk):
+            if self.check_stop():
+                break
+            self.pause_point()
+            
+            part = values[start:start + chunk]
+            timeout_ms = int(len(part) * (point_ms + 2000.0)) + 10000
+            response = self.send_to_manager({
+                "action": "PMT_SCAN",
+                "source": self._source,
+                "channel": device,
+                "values": part,
+                "settling_ms": settling_ms,
+                "duration_ms": duration_ms
+            }, timeout_ms=timeout_ms)
+            
+            if response.get("status") != "success":
+                if response.get("code") == "UNKNOWN_ACTION":
+                    self.logger.info("Manager does not support PMT_SCAN")
+                else:
+                    self.logger.warning(f"PMT scan failed: {response.get('message', 'Unknown error')}")
+                return None
+            counts.extend(None if c is None else int(c) for c in response.get("counts", []))
+        
+        return counts
+    
+    def set_and_measure(self, voltages: Dict[str, float], settle_ms: float,
+                        gate_ms: float = 100.0) -> Optional[int]:
+        """
+        Set voltages, wait settle_ms, then measure PMT, in one request.
+        
+        Falls back to separate SET and PMT_MEASURE requests if the manager
+        does not support SET_MEASURE.
+        
+        Args:
+            voltages: Device -> value to set
+            settle_ms: Wait after setting before the PMT gate opens
+            gate_ms: PMT gate duration
+        
+        Returns:
+            PMT count, or None if setting or measuring failed
+        """
+        response = self.send_to_manager({
+            "action": "SET_MEASURE",
+            "source": self._source,
+            "params": voltages,
+            "settle_ms": settle_ms,
+            "duration_ms": gate_ms
+        }, timeout_ms=int(settle_ms + gate_ms) + 10000)
+        
+        if response.get("status") == "success" and response.get("counts") is not None:
+            return int(response["counts"])
+        
+        if response.get("code") == "UNKNOWN_ACTION":
+            if not self.set_multiple_voltages(voltages):
+                return None
+            self.sleep(settle_ms / 1000.0)
+            return self.measure_pmt(duration_ms=gate_ms)
+        
+        self.logger.warning(f"SET_MEASURE failed: {response.get('message', 'Unknown error')}")
+        return None
+    
     def set_multiple_voltages(self, voltages: Dict[str, float]) -> bool:
         """Set multiple voltages at once."""
         response = self.send_to_manager({
             "action": "SET",
-            "source": f"EXPERIMENT_{self.name.upper()}",
+            "source": self._source,
             "params": voltages
         })
         success = response.get("status") == "success"
@@ -314,19 +644,24 @@ class BaseExperiment(ABC):
         """Check for pause request and wait if needed."""
         if self._pause_event.is_set():
             self.set_status(ExperimentStatus.PAUSED)
-            while self._pause_event.is_set() and not self._stop_event.is_set():
-                time.sleep(0.1)
+            with self._control:
+                self._control.wait_for(
+                    lambda: not self._pause_event.is_set() or self._stop_event.is_set()
+                )
             if not self._stop_event.is_set():
                 self.set_status(ExperimentStatus.RUNNING)
     
     def sleep(self, seconds: float):
-        """Sleep with stop/pause checking."""
-        end_time = time.time() + seconds
-        while time.time() < end_time:
-            if self.check_stop():
-                return
+        """Sleep with stop/pause checking (wakes as soon as either is requested)."""
+        deadline = time.monotonic() + seconds
+        while not self.check_stop():
             self.pause_point()
-            time.sleep(min(0.1, end_time - time.time()))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            with self._control:
+                if not (self._stop_event.is_set() or self._pause_event.is_set()):
+                    self._control.wait(remaining)
     
     # ==================== Execution Control ====================
     
@@ -351,6 +686,8 @@ class BaseExperiment(ABC):
         # Clear old data
         with self._data_lock:
             self.data = {}
+        if self.stream_records:
+            self._open_record_stream()
         
         if blocking:
             self._run()
@@ -378,8 +715,12 @@ class BaseExperiment(ABC):
                 self.set_status(ExperimentStatus.ERROR)
                 self.logger.error(f"Experiment failed: {result.error}")
             
-            # Save data
-            self.save_data()
+            # Save data on the writer thread; the snapshot is taken here so
+            # a new run can start while the file is being written
+            filepath, data_to_save = self._snapshot_data()
+            self._close_record_stream()
+            self.save_future = _WRITER.submit(self._write_data, filepath, data_to_save)
+            self.save_future.add_done_callback(self._on_save_done)
             
         except Exception as e:
             self.logger.exception("Experiment crashed")
@@ -389,24 +730,31 @@ class BaseExperiment(ABC):
                 message="Experiment crashed"
             )
             self.set_status(ExperimentStatus.ERROR)
+            self._close_record_stream()
     
     def stop(self):
         """Request experiment stop."""
         self.logger.info("Stop requested")
-        self._stop_event.set()
-        self._pause_event.clear()
+        with self._control:
+            self._stop_event.set()
+            self._pause_event.clear()
+            self._control.notify_all()
     
     def pause(self):
         """Request experiment pause."""
         if self.status == ExperimentStatus.RUNNING:
             self.logger.info("Pause requested")
-            self._pause_event.set()
+            with self._control:
+                self._pause_event.set()
+                self._control.notify_all()
     
     def resume(self):
-        """Resume paused experiment."""
-        if self.status == ExperimentStatus.PAUSED:
+        """Resume paused experiment (or cancel a pause not yet reached)."""
+        if self._pause_event.is_set():
             self.logger.info("Resume requested")
-            self._pause_event.clear()
+            with self._control:
+                self._pause_event.clear()
+                self._control.notify_all()
     
     def wait(self, timeout: Optional[float] = None) -> Optional[ExperimentResult]:
         """Wait for experiment to complete."""
@@ -437,16 +785,14 @@ class BaseExperiment(ABC):
     
     def cleanup(self):
         """Cleanup resources. Override if needed."""
+        if self.save_future is not None:
+            wait_futures([self.save_future])
+        self._close_record_stream()
         with self._zmq_lock:
-            if self._zmq_socket:
-                try:
-                    self._zmq_socket.close()
-                except:
-                    pass
-                self._zmq_socket = None
-            if self._zmq_context:
+            for sock in self._zmq_sockets:
                 try:
-                    self._zmq_context.term()
+                    sock.close()
                 except:
                     pass
-                self._zmq_context = None
+            self._zmq_sockets.clear()
+            # The shared context is never terminated here
@@ -2,13 +2,13 @@
 Experiment Controller for the Applet Server.
 
 Manages experiment execution and provides API endpoints.
-Singleton pattern - use `controller` instance.
+Use the module-level `controller` instance; constructing
+ExperimentController() gives an independent controller.
 """
 
 import threading
 import logging
 from typing import Dict, Any, Optional, List
-from dataclasses import asdict
 
 from ..base import ExperimentStatus
 from ..auto_compensation import AutoCompensationExperiment
@@ -26,7 +26,7 @@ except ImportError:
 
 class ExperimentController:
     """
-    Singleton controller for managing experiments.
+    Controller for managing experiments.
     
     Provides:
     - Experiment registry
@@ -35,22 +35,7 @@ class ExperimentController:
     - WebSocket/SSE broadcasting
     """
     
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
         self.logger = logging.getLogger("applet.controller")
         
         # Registry of available experiments
@@ -64,9 +49,11 @@ class ExperimentController:
         if _TRAP_EIGENMODE_AVAILABLE and TrapEigenmodeExperiment is not None:
             self._experiments["trap_eigenmode"] = TrapEigenmodeExperiment
         
-        # Currently running experiment
+        # Currently running experiment. _current_lock only guards the
+        # check-and-reserve in start(); readers take a snapshot of _current.
         self._current: Optional[Any] = None
         self._current_lock = threading.RLock()
+        self._starting = False
         
         # Progress callbacks (for SSE broadcasting)
         self._progress_callbacks: List[Any] = []
@@ -104,12 +91,18 @@ class ExperimentController:
         Returns:
             Response dict with status and message
         """
+        # Check and reserve under the lock; build and start outside it
         with self._current_lock:
-            # Check if experiment already running
-            if self._current is not None and self._current.status == ExperimentStatus.RUNNING:
+            current = self._current
+            if self._starting:
+                return {
+                    "status": "error",
+                    "message": "Another experiment is starting"
+                }
+            if current is not None and current.status == ExperimentStatus.RUNNING:
                 return {
                     "status": "error",
-                    "message": f"Experiment '{self._current.name}' already running"
+                    "message": f"Experiment '{current.name}' already running"
                 }
             
             # Get experiment class
@@ -119,15 +112,17 @@ class ExperimentController:
                     "status": "error",
                     "message": f"Unknown experiment: {exp_id}"
                 }
-            
+            self._starting = True
+        
+        try:
             # Create instance
             try:
                 config = config or {}
-                self._current = exp_class(**config)
+                experiment = exp_class(**config)
                 
                 # Register callbacks for SSE
-                self._current.add_progress_callback(self._on_progress)
-                self._current.add_status_callback(self._on_status)
+                experiment.add_progress_callback(self._on_progress)
+                experiment.add_status_callback(self._on_status)
                 
             except Exception as e:
                 self.logger.error(f"Failed to create experiment: {e}")
@@ -136,8 +131,9 @@ class ExperimentController:
                     "message": f"Failed to create experiment: {e}"
                 }
             
-            # Start experiment
-            success = self._current.start(blocking=False)
+            # Publish before starting so status polls see the new run
+            self._current = experiment
+            success = experiment.start(blocking=False)
             
             if success:
                 return {
@@ -151,6 +147,9 @@ class ExperimentController:
                     "status": "error",
                     "message": "Failed to start experiment"
                 }
+        finally:
+            with self._current_lock:
+                self._starting = False
     
     def stop(self) -> Dict[str, Any]:
         """Stop current experiment."""
@@ -192,32 +191,32 @@ class ExperimentController:
     
     def get_status(self) -> Dict[str, Any]:
         """Get current experiment status."""
-        with self._current_lock:
-            if self._current is None:
-                return {
-                    "status": "idle",
-                    "experiment": None,
-                    "progress": 0,
-                    "message": "No experiment running"
-                }
-            
-            result = self._current.result
-            
+        current = self._current  # single read, no lock needed
+        if current is None:
             return {
-                "status": self._current.status.value,
-                "experiment": self._current.name,
-                "progress": self._current.progress,
-                "data": self._current.data,
-                "result": asdict(result) if result else None,
-                "message": result.message if result else "Running"
+                "status": "idle",
+                "experiment": None,
+                "progress": 0,
+                "message": "No experiment running"
             }
+        
+        result = current.result
+        
+        return {
+            "status": current.status.value,
+            "experiment": current.name,
+            "progress": current.progress,
+            "data": current.data,
+            "result": result.as_dict() if result else None,
+            "message": result.message if result else "Running"
+        }
     
     def get_progress(self) -> float:
         """Get current progress (0-100)."""
-        with self._current_lock:
-            if self._current is None:
-                return 0.0
-            return self._current.progress
+        current = self._current
+        if current is None:
+            return 0.0
+        return current.progress
     
     # ==================== Callback Broadcasting ====================
     
@@ -246,5 +245,5 @@ class ExperimentController:
         self._status_callbacks.append(callback)
 
 
-# Singleton instance
+# Shared instance used by the applet server (created once at import)
 controller = ExperimentController()
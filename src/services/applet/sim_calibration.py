@@ -24,22 +24,70 @@ Usage:
     # or via controller API
 """
 
+import os
+import sys
 import time
+import bisect
+import itertools
+import functools
 import json
 import csv
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import io
+import re
 
 import numpy as np
+from scipy.signal import find_peaks
 
 from .base import BaseExperiment, ExperimentStatus, ExperimentResult
 
+# Optional orjson for the measurement data file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+# Reference data file and fit code, both under src/analysis/eigenmodes
+_FIT_MODULE_PATH = Path(__file__).resolve().parents[2] / "analysis" / "eigenmodes"
+_REFERENCE_FILE = _FIT_MODULE_PATH / "reference eigenfrequencies.md"
+
+# Kappa/chi fit (imported once here rather than on every run_fit call)
+try:
+    from analysis.eigenmodes.fit_Kappa_Chi_URF import DataSet, fit_chi_kappa_multi
+    FIT_AVAILABLE = True
+except ImportError:
+    FIT_AVAILABLE = False
+
+
+# Reference file cells ("420.0(5)" -> value, uncertainty) and column
+# names ("V_end=10V wx (2pi kHz)" -> V_end, axis)
+_REFERENCE_VALUE = re.compile(r'\s*(-?\d[\d.]*|-?\.\d+)(?:\(([\d.]+)?\))?')
+_REFERENCE_COLUMN = re.compile(r'v_end\s*=\s*([-\d.]+)(?:.*?(wx|wy))?', re.IGNORECASE)
+_COLUMN_AXES = {'wx': 'radial_x', 'wy': 'radial_y'}
+
+
+# Columnar copy of SimCalibrationExperiment.measurements (uncertainty
+# already defaulted to 0.5 kHz)
+MEASUREMENT_DTYPE = np.dtype([
+    ("u_rf", "f8"),
+    ("v_end", "f8"),
+    ("axis", "U8"),
+    ("freq", "f8"),
+    ("unc", "f8"),
+])
+
+
+# Slotted dataclasses where available (slots= needs Python 3.10)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SecularMeasurement:
     """Single secular frequency measurement."""
     u_rf: float
@@ -48,10 +96,11 @@ class SecularMeasurement:
     frequency_khz: float
     uncertainty_khz: Optional[float] = None
     timestamp: Optional[str] = None
-    pmt_data: Optional[List[int]] = None
+    # PMT counts per sweep point (int32)
+    pmt_data: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FitResult:
     """Result from fit_Kappa_Chi_URF."""
     chi_x: float
@@ -86,6 +135,12 @@ class SimCalibrationExperiment(BaseExperiment):
         attenuation_db: DDS attenuation [dB]
     """
     
+    # Wait after setting trap voltages before sweeping [s]: the full time
+    # after a V_end change, otherwise scaled with the U_RF step
+    voltage_settle_s = 0.5
+    voltage_settle_min_s = 0.02
+    voltage_settle_s_per_volt = 0.005
+    
     def __init__(
         self,
         manager_host: str = "localhost",
@@ -110,6 +165,9 @@ class SimCalibrationExperiment(BaseExperiment):
         self.on_time_ms: float = 100.0
         self.off_time_ms: float = 100.0
         self.attenuation_db: float = 25.0
+        # Measure radial_x and radial_y from one sweep covering both peaks
+        # (the sweep must resolve both modes, so this is opt-in)
+        self.run_dual_radial: bool = False
         
         # Axial vs radial frequency ranges (for intelligent sweep centering)
         self.axial_freq_range: Tuple[float, float] = (200.0, 1000.0)  # kHz
@@ -117,16 +175,33 @@ class SimCalibrationExperiment(BaseExperiment):
         
         # Results storage
         self.measurements: List[SecularMeasurement] = []
+        # Same measurements as a structured array; add them with
+        # _add_measurement() to keep both in step
+        self._meas_arr = np.zeros(0, dtype=MEASUREMENT_DTYPE)
+        # (u_rf, v_end, axis) -> first measurement there, see _find_measurement
+        self._measurement_index: Dict[Tuple[float, float, str], SecularMeasurement] = {}
         self.reference_data: Dict[str, Any] = {}
+        # Data key -> (sorted U_RF, frequency) lists for estimate_sweep_center
+        self._interp_tables: Dict[str, Tuple[List[float], List[float]]] = {}
         self.fit_result: Optional[FitResult] = None
         
         # Paths
-        self.reference_file = Path(__file__).parent.parent.parent / "analysis" / "eigenmodes" / "reference eigenfrequencies.md"
-        self.fit_module_path = Path(__file__).parent.parent.parent / "analysis" / "eigenmodes"
+        self.reference_file = _REFERENCE_FILE
+        self.fit_module_path = _FIT_MODULE_PATH
+        
+        # Trap voltages (u_rf, v_end) last set successfully, so repeated
+        # settings skip the request and settle wait
+        self._last_set_voltages: Optional[Tuple[float, float]] = None
         
         # Measurement tracking
         self.current_measurement_index: int = 0
         self.total_measurements: int = 0
+        
+        # Reference file rewrites during a scan: at most one per interval,
+        # plus a final one when the scan ends
+        self.reference_save_interval_s: float = 5.0
+        self._last_reference_save: float = 0.0
+        self._reference_unsaved: bool = False
     
     def load_reference_data(self) -> Dict[str, Any]:
         """
@@ -142,68 +217,52 @@ class SimCalibrationExperiment(BaseExperiment):
             return self._create_empty_reference()
         
         try:
-            # Parse the markdown/CSV file
-            with open(self.reference_file, 'r') as f:
-                content = f.read()
-            
-            # Parse CSV content (skip header line if it starts with #)
-            lines = content.strip().split('\n')
-            csv_lines = [line for line in lines if not line.startswith('#')]
-            
-            if not csv_lines:
-                return self._create_empty_reference()
-            
-            # Parse header
-            header = csv_lines[0].split(',')
-            
-            # Parse data rows
-            data = {}
-            for line in csv_lines[1:]:
-                parts = line.split(',')
-                if len(parts) >= 2:
+            # Parse the markdown/CSV file line by line (skip blank lines and
+            # comment lines starting with #)
+            with open(self.reference_file, 'r', newline='', buffering=1 << 16) as f:
+                reader = csv.reader(line for line in f if line.strip() and not line.startswith('#'))
+                
+                header = next(reader, None)
+                if header is None:
+                    return self._create_empty_reference()
+                
+                # Classify the V_end columns once: (column index, data key)
+                columns = []
+                for i, col in enumerate(header[1:], 1):
+                    # V_end and axis (wx/wy) from the column name
+                    col_match = _REFERENCE_COLUMN.search(col)
+                    if col_match is not None:
+                        v_end, axis = col_match.groups()
+                        axis = _COLUMN_AXES.get(axis and axis.lower(), 'unknown')
+                        columns.append((i, f"v{float(v_end)}_{axis}"))
+                
+                # Parse data rows as they are read
+                data = {}
+                for parts in reader:
+                    if len(parts) < 2:
+                        continue
                     u_rf = float(parts[0])
                     data[u_rf] = {}
                     
-                    # Parse each V_end column
-                    for i, col in enumerate(header[1:], 1):
-                        if i < len(parts) and parts[i] and parts[i] != '-':
-                            # Parse frequency and uncertainty
-                            freq_str = parts[i].strip()
-                            # Format: "value(uncertainty)" e.g., "420.0(5)"
-                            if '(' in freq_str:
-                                freq_val = float(freq_str.split('(')[0])
-                                unc_str = freq_str.split('(')[1].rstrip(')')
-                                uncertainty = float(unc_str) if unc_str else 0.5
-                            else:
-                                freq_val = float(freq_str)
-                                uncertainty = 0.5
-                            
-                            # Determine axis from column name
-                            if 'wx' in col.lower():
-                                axis = 'radial_x'
-                            elif 'wy' in col.lower():
-                                axis = 'radial_y'
-                            else:
-                                axis = 'unknown'
-                            
-                            # Extract V_end from column name
-                            v_end = None
-                            if 'v_end=' in col.lower():
-                                v_str = col.lower().split('v_end=')[1].split()[0]
-                                v_end = float(v_str.rstrip('v'))
-                            
-                            if v_end is not None:
-                                key = f"v{v_end}_{axis}"
-                                data[u_rf][key] = {
-                                    'frequency_khz': freq_val,
-                                    'uncertainty_khz': uncertainty
-                                }
+                    for i, key in columns:
+                        if i >= len(parts):
+                            break
+                        # Format: "value(uncertainty)" e.g., "420.0(5)"; '-' = missing
+                        match = _REFERENCE_VALUE.match(parts[i])
+                        if match is None:
+                            continue
+                        freq_val, unc_str = match.groups()
+                        data[u_rf][key] = {
+                            'frequency_khz': float(freq_val),
+                            'uncertainty_khz': float(unc_str) if unc_str else 0.5
+                        }
             
             self.reference_data = {
                 'header': header,
                 'data': data,
                 'source': str(self.reference_file)
             }
+            self._interp_tables = self._build_interp_tables(data)
             
             self.logger.info(f"Loaded reference data for {len(data)} U_RF values")
             return self.reference_data
@@ -212,6 +271,18 @@ class SimCalibrationExperiment(BaseExperiment):
             self.logger.error(f"Error loading reference data: {e}")
             return self._create_empty_reference()
     
+    @staticmethod
+    def _build_interp_tables(data: Dict[float, Dict[str, Any]]) -> Dict[str, Tuple[List[float], List[float]]]:
+        """Per data key, the U_RF values that have it (sorted) and their frequencies."""
+        points: Dict[str, List[Tuple[float, float]]] = {}
+        for u_rf in sorted(data):
+            for key, ref in data[u_rf].items():
+                points.setdefault(key, []).append((u_rf, ref['frequency_khz']))
+        return {
+            key: ([u for u, _ in pts], [f for _, f in pts])
+            for key, pts in points.items()
+        }
+    
     def _create_empty_reference(self) -> Dict[str, Any]:
         """Create empty reference data structure."""
         return {
@@ -220,78 +291,94 @@ class SimCalibrationExperiment(BaseExperiment):
             'source': str(self.reference_file)
         }
     
+    def _iter_reference_rows(self):
+        """Yield reference CSV data rows, one U_RF value at a time."""
+        ref_data = self.reference_data.get('data', {})
+        all_u_rf = sorted(set(ref_data) | {m.u_rf for m in self.measurements})
+        v_ends = sorted(self.v_end_values)
+        
+        for u_rf in all_u_rf:
+            ref = ref_data.get(u_rf, {})
+            row = [str(u_rf)]
+            
+            for v_end in v_ends:
+                for axis in ('radial_x', 'radial_y'):
+                    # Measurement first, then reference data
+                    cell = None
+                    meas = self._find_measurement(u_rf, v_end, axis)
+                    if meas is not None:
+                        cell = (meas.frequency_khz, meas.uncertainty_khz or 0.5)
+                    else:
+                        ref_cell = ref.get(f'v{v_end}_{axis}')
+                        if ref_cell is not None:
+                            cell = (ref_cell['frequency_khz'], ref_cell['uncertainty_khz'])
+                    
+                    # Format: value(uncertainty), or '-' if unknown
+                    row.append(f"{cell[0]:.1f}({cell[1]:.1f})" if cell else '-')
+            
+            yield row
+    
     def save_reference_data(self):
         """Save updated reference data back to CSV file."""
         try:
-            # Build CSV content
-            lines = []
-            
             # Build header based on v_end values and axes
             header = ['U_RF (V)']
             for v_end in sorted(self.v_end_values):
                 header.append(f'V_end={v_end}V wx (2pi kHz)')
                 header.append(f'V_end={v_end}V wy (2pi kHz)')
-            lines.append(','.join(header))
-            
-            # Build data rows
-            all_u_rf = sorted(set(list(self.reference_data.get('data', {}).keys()) + 
-                                   [m.u_rf for m in self.measurements]))
             
-            for u_rf in all_u_rf:
-                row = [str(u_rf)]
-                
-                for v_end in sorted(self.v_end_values):
-                    # Find measurements for this u_rf, v_end
-                    wx_meas = self._find_measurement(u_rf, v_end, 'radial_x')
-                    wy_meas = self._find_measurement(u_rf, v_end, 'radial_y')
-                    
-                    # Format: value(uncertainty) or just value
-                    if wx_meas:
-                        unc = wx_meas.uncertainty_khz or 0.5
-                        row.append(f"{wx_meas.frequency_khz:.1f}({unc:.1f})")
-                    else:
-                        # Check reference data
-                        ref = self.reference_data.get('data', {}).get(u_rf, {})
-                        wx_key = f'v{v_end}_radial_x'
-                        if wx_key in ref:
-                            f = ref[wx_key]['frequency_khz']
-                            u = ref[wx_key]['uncertainty_khz']
-                            row.append(f"{f:.1f}({u:.1f})")
-                        else:
-                            row.append('-')
-                    
-                    if wy_meas:
-                        unc = wy_meas.uncertainty_khz or 0.5
-                        row.append(f"{wy_meas.frequency_khz:.1f}({unc:.1f})")
-                    else:
-                        ref = self.reference_data.get('data', {}).get(u_rf, {})
-                        wy_key = f'v{v_end}_radial_y'
-                        if wy_key in ref:
-                            f = ref[wy_key]['frequency_khz']
-                            u = ref[wy_key]['uncertainty_khz']
-                            row.append(f"{f:.1f}({u:.1f})")
-                        else:
-                            row.append('-')
-                
-                lines.append(','.join(row))
-            
-            # Write to file
-            with open(self.reference_file, 'w') as f:
-                f.write('\n'.join(lines))
+            # Write to a temp file and swap it in, so an interrupted save
+            # never leaves a truncated reference file. The 1 MiB buffer
+            # makes this a single write() for any realistic table.
+            tmp_file = self.reference_file.with_name(self.reference_file.name + '.tmp')
+            with open(tmp_file, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(header)
+                writer.writerows(self._iter_reference_rows())
+            os.replace(tmp_file, self.reference_file)
             
             self.logger.info(f"Reference data saved to: {self.reference_file}")
             
         except Exception as e:
             self.logger.error(f"Error saving reference data: {e}")
     
+    @staticmethod
+    def _measurement_key(u_rf: float, v_end: float, axis: str) -> Tuple[float, float, str]:
+        """Index key for a measurement (rounded so float keys compare equal)."""
+        return (round(u_rf, 3), round(v_end, 3), axis)
+    
+    @property
+    def measurement_array(self) -> np.ndarray:
+        """The measurements as a MEASUREMENT_DTYPE array (a view, in order)."""
+        return self._meas_arr[:len(self.measurements)]
+    
+    def _add_measurement(self, measurement: SecularMeasurement):
+        """Append a measurement and index it (the first one per key is kept)."""
+        n = len(self.measurements)
+        if n == len(self._meas_arr):
+            grown = np.zeros(max(16, 2 * n), dtype=MEASUREMENT_DTYPE)
+            grown[:n] = self._meas_arr
+            self._meas_arr = grown
+        self._meas_arr[n] = (
+            measurement.u_rf, measurement.v_end, measurement.axis,
+            measurement.frequency_khz, measurement.uncertainty_khz or 0.5
+        )
+        self.measurements.append(measurement)
+        self._measurement_index.setdefault(
+            self._measurement_key(measurement.u_rf, measurement.v_end, measurement.axis),
+            measurement
+        )
+    
+    def _flush_reference_data(self):
+        """Save reference data if measurements were added since the last save."""
+        if self._reference_unsaved:
+            self.save_reference_data()
+            self._reference_unsaved = False
+            self._last_reference_save = time.monotonic()
+    
     def _find_measurement(self, u_rf: float, v_end: float, axis: str) -> Optional[SecularMeasurement]:
         """Find a measurement by parameters."""
-        for m in self.measurements:
-            if (abs(m.u_rf - u_rf) < 0.1 and 
-                abs(m.v_end - v_end) < 0.1 and 
-                m.axis == axis):
-                return m
-        return None
+        return self._measurement_index.get(self._measurement_key(u_rf, v_end, axis))
     
     def estimate_sweep_center(self, u_rf: float, v_end: float, axis: str) -> float:
         """
@@ -311,42 +398,49 @@ class SimCalibrationExperiment(BaseExperiment):
         if ref:
             return ref['frequency_khz']
         
-        # Interpolate from nearby U_RF values
-        u_rf_values = sorted(self.reference_data.get('data', {}).keys())
-        if len(u_rf_values) >= 2:
-            # Find bracketing U_RF values
-            lower_u = None
-            upper_u = None
-            for u in u_rf_values:
-                if u <= u_rf:
-                    lower_u = u
-                if u >= u_rf and upper_u is None:
-                    upper_u = u
-                    break
-            
-            if lower_u is not None and upper_u is not None and lower_u != upper_u:
-                lower_ref = self.reference_data['data'][lower_u].get(key)
-                upper_ref = self.reference_data['data'][upper_u].get(key)
-                if lower_ref and upper_ref:
-                    # Linear interpolation
-                    frac = (u_rf - lower_u) / (upper_u - lower_u)
-                    freq = lower_ref['frequency_khz'] + frac * (
-                        upper_ref['frequency_khz'] - lower_ref['frequency_khz']
-                    )
-                    return freq
+        # Interpolate between the nearest U_RF values that have this key
+        table = self._interp_tables.get(key)
+        if table is not None:
+            xs, ys = table
+            i = bisect.bisect_left(xs, u_rf)
+            if 0 < i < len(xs):
+                frac = (u_rf - xs[i - 1]) / (xs[i] - xs[i - 1])
+                return ys[i - 1] + frac * (ys[i] - ys[i - 1])
         
         # Fallback to physics estimates
+        return self._physics_center(v_end, axis, u_rf)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _physics_center(v_end: float, axis: str, u_rf: float) -> float:
+        """Physics-model sweep center [kHz] (grid values repeat, so results are cached)."""
         if 'axial' in axis:
             # Axial frequency scales as sqrt(V_end)
             # Estimate based on typical values
             base_freq = 400.0  # kHz at 10V
-            return base_freq * np.sqrt(v_end / 10.0)
+            return float(base_freq * np.sqrt(v_end / 10.0))
         else:
             # Radial frequency depends on both U_RF and V_end
             # Roughly linear with U_RF
             base_freq = 450.0  # kHz at 57.1V, 10V
             return base_freq * (u_rf / 57.1)
     
+    def _scan_schedule(self) -> List[Tuple[float, float]]:
+        """(u_rf, v_end) points in measurement order (U_RF reversed on every other V_end)."""
+        schedule = []
+        for i, v_end in enumerate(self.v_end_values):
+            u_rf_values = self.u_rf_values if i % 2 == 0 else self.u_rf_values[::-1]
+            schedule.extend((u_rf, v_end) for u_rf in u_rf_values)
+        return schedule
+    
+    def _settle_time(self, u_rf: float, v_end: float) -> float:
+        """Settle wait [s] for moving from the last set trap voltages to these."""
+        last = self._last_set_voltages
+        if last is None or last[1] != v_end:
+            return self.voltage_settle_s
+        return min(self.voltage_settle_s,
+                   self.voltage_settle_min_s + self.voltage_settle_s_per_volt * abs(u_rf - last[0]))
+    
     def set_trap_voltages(self, u_rf: float, v_end: float) -> bool:
         """
         Set trap voltages via manager.
@@ -358,6 +452,10 @@ class SimCalibrationExperiment(BaseExperiment):
         Returns:
             True if successful
         """
+        if self._last_set_voltages == (u_rf, v_end):
+            self.logger.debug(f"Trap voltages already U_RF={u_rf}V, V_end={v_end}V")
+            return True
+        
         self.logger.info(f"Setting trap voltages: U_RF={u_rf}V, V_end={v_end}V")
         
         # Set RF voltage via LabVIEW (through manager)
@@ -374,26 +472,16 @@ class SimCalibrationExperiment(BaseExperiment):
         if response.get("status") == "success":
             self.logger.info("Trap voltages set successfully")
             # Wait for voltages to settle
-            time.sleep(0.5)
+            self.sleep(self._settle_time(u_rf, v_end))
+            self._last_set_voltages = (u_rf, v_end)
             return True
         else:
             self.logger.error(f"Failed to set trap voltages: {response.get('message')}")
+            self._last_set_voltages = None
             return False
     
-    def measure_secular_frequency(self, u_rf: float, v_end: float, axis: str) -> Optional[SecularMeasurement]:
-        """
-        Measure secular frequency for given trap parameters and axis.
-        
-        Args:
-            u_rf: RF voltage [V]
-            v_end: Endcap voltage [V]
-            axis: 'axial', 'radial_x', or 'radial_y'
-            
-        Returns:
-            SecularMeasurement with results
-        """
-        self.logger.info(f"Measuring {axis} secular frequency at U_RF={u_rf}V, V_end={v_end}V")
-        
+    def _build_sweep_params(self, u_rf: float, v_end: float, axis: str) -> Dict[str, Any]:
+        """SECULAR_SWEEP parameters for one axis at the given trap voltages."""
         # Estimate sweep center
         center_freq = self.estimate_sweep_center(u_rf, v_end, axis)
         
@@ -409,8 +497,7 @@ class SimCalibrationExperiment(BaseExperiment):
         else:
             span = self.sweep_span_khz
         
-        # Run secular sweep via manager/ARTIQ
-        sweep_params = {
+        return {
             "target_frequency_khz": center_freq,
             "span_khz": span,
             "steps": self.sweep_steps,
@@ -420,34 +507,35 @@ class SimCalibrationExperiment(BaseExperiment):
             "dds_choice": dds_choice,
             "axis": axis  # Pass axis info for any axis-specific handling
         }
-        
-        response = self.send_to_manager({
-            "action": "SECULAR_SWEEP",
-            "source": "EXPERIMENT_SIM_CALIB",
-            "params": sweep_params,
-            "timeout_ms": int((self.on_time_ms + self.off_time_ms) * self.sweep_steps + 30000)
-        })
+    
+    def _sweep_timeout_ms(self) -> int:
+        """Time allowed for one sweep, including manager/ARTIQ overhead."""
+        return int((self.on_time_ms + self.off_time_ms) * self.sweep_steps + 30000)
+    
+    def _parse_sweep_response(self, u_rf: float, v_end: float, sweep_params: Dict[str, Any],
+                              response: Dict[str, Any]) -> Optional[SecularMeasurement]:
+        """Turn a SECULAR_SWEEP response into a measurement (None if it failed)."""
+        axis = sweep_params["axis"]
+        span = sweep_params["span_khz"]
         
         if response.get("status") != "success":
             self.logger.error(f"Secular sweep failed: {response.get('message')}")
             return None
         
-        # Extract sweep data
+        # Extract sweep data (converted to arrays once)
         sweep_data = response.get("sweep_data", {})
-        frequencies = sweep_data.get("frequencies_khz", [])
-        pmt_counts = sweep_data.get("pmt_counts", [])
+        frequencies = np.asarray(sweep_data.get("frequencies_khz", []), dtype=np.float64)
+        pmt_counts = np.asarray(sweep_data.get("pmt_counts", []), dtype=np.int32)
         
-        if not frequencies or not pmt_counts:
+        if not frequencies.size or not pmt_counts.size:
             self.logger.error("No sweep data returned")
             return None
         
         # Find peak (secular frequency)
-        peak_idx = np.argmax(pmt_counts)
-        peak_freq = frequencies[peak_idx]
-        
-        # Estimate uncertainty based on sweep step size
-        step_size = span / (self.sweep_steps - 1)
-        uncertainty = step_size / 2
+        step_size = span / (sweep_params["steps"] - 1)
+        peak_freq, uncertainty = self._refine_peak(
+            frequencies, pmt_counts, int(pmt_counts.argmax()), step_size
+        )
         
         measurement = SecularMeasurement(
             u_rf=u_rf,
@@ -463,6 +551,179 @@ class SimCalibrationExperiment(BaseExperiment):
         
         return measurement
     
+    @staticmethod
+    def _refine_peak(frequencies: np.ndarray, pmt_counts: np.ndarray, peak_idx: int,
+                     step_size: float) -> Tuple[float, float]:
+        """
+        Peak frequency and uncertainty [kHz] around sweep point peak_idx.
+        
+        Refines to the vertex of the parabola through the peak and its
+        neighbours; the uncertainty then shrinks with the peak counts
+        instead of being half a step.
+        """
+        peak_freq = float(frequencies[peak_idx])
+        uncertainty = step_size / 2
+        if 0 < peak_idx < min(len(pmt_counts), len(frequencies)) - 1:
+            y0, y1, y2 = pmt_counts[peak_idx - 1:peak_idx + 2].astype(np.float64)
+            curvature = y0 - 2 * y1 + y2
+            if curvature < 0:
+                offset_bins = 0.5 * (y0 - y2) / curvature
+                bin_khz = (frequencies[peak_idx + 1] - frequencies[peak_idx - 1]) / 2
+                peak_freq += float(offset_bins * bin_khz)
+                uncertainty = step_size / np.sqrt(12 * max(int(pmt_counts[peak_idx]), 1))
+        return peak_freq, float(uncertainty)
+    
+    def measure_secular_frequency(self, u_rf: float, v_end: float, axis: str) -> Optional[SecularMeasurement]:
+        """
+        Measure secular frequency for given trap parameters and axis.
+        
+        Args:
+            u_rf: RF voltage [V]
+            v_end: Endcap voltage [V]
+            axis: 'axial', 'radial_x', or 'radial_y'
+            
+        Returns:
+            SecularMeasurement with results
+        """
+        self.logger.info(f"Measuring {axis} secular frequency at U_RF={u_rf}V, V_end={v_end}V")
+        
+        # Run secular sweep via manager/ARTIQ
+        sweep_params = self._build_sweep_params(u_rf, v_end, axis)
+        timeout_ms = self._sweep_timeout_ms()
+        response = self.send_to_manager({
+            "action": "SECULAR_SWEEP",
+            "source": "EXPERIMENT_SIM_CALIB",
+            "params": sweep_params,
+            "timeout_ms": timeout_ms
+        }, timeout_ms=timeout_ms)
+        
+        return self._parse_sweep_response(u_rf, v_end, sweep_params, response)
+    
+    def measure_dual_radial(self, u_rf: float, v_end: float) -> Dict[str, SecularMeasurement]:
+        """
+        Measure both radial modes from a single sweep covering both.
+        
+        The sweep spans both reference estimates plus the usual span, at
+        the usual step size. The two most prominent peaks are taken as the
+        radial modes, the lower one as radial_x (wx < wy in the reference
+        data). Both measurements share the sweep's pmt_data.
+        
+        Returns:
+            {'radial_x': ..., 'radial_y': ...}, or {} if the sweep failed
+            or did not show two peaks
+        """
+        self.logger.info(f"Measuring both radial modes in one sweep at U_RF={u_rf}V, V_end={v_end}V")
+        
+        f_x = self.estimate_sweep_center(u_rf, v_end, 'radial_x')
+        f_y = self.estimate_sweep_center(u_rf, v_end, 'radial_y')
+        step_size = self.sweep_span_khz / (self.sweep_steps - 1)
+        span = self.sweep_span_khz + abs(f_y - f_x)
+        steps = int(round(span / step_size)) + 1
+        
+        sweep_params = self._build_sweep_params(u_rf, v_end, 'radial_x')
+        sweep_params.update({
+            "target_frequency_khz": (f_x + f_y) / 2,
+            "span_khz": span,
+            "steps": steps,
+            "axis": "radial"
+        })
+        timeout_ms = int((self.on_time_ms + self.off_time_ms) * steps + 30000)
+        response = self.send_to_manager({
+            "action": "SECULAR_SWEEP",
+            "source": "EXPERIMENT_SIM_CALIB",
+            "params": sweep_params,
+            "timeout_ms": timeout_ms
+        }, timeout_ms=timeout_ms)
+        
+        if response.get("status") != "success":
+            self.logger.error(f"Dual radial sweep failed: {response.get('message')}")
+            return {}
+        
+        sweep_data = response.get("sweep_data", {})
+        frequencies = np.asarray(sweep_data.get("frequencies_khz", []), dtype=np.float64)
+        pmt_counts = np.asarray(sweep_data.get("pmt_counts", []), dtype=np.int32)
+        n = min(len(frequencies), len(pmt_counts))
+        if n < 3:
+            self.logger.error("No sweep data returned")
+            return {}
+        
+        # Peaks must stand well out of the background shot noise, and the
+        # weaker mode must be comparable to the stronger one
+        noise = np.sqrt(max(float(np.median(pmt_counts[:n])), 1.0))
+        peaks, props = find_peaks(pmt_counts[:n], distance=max(1, steps // 8), prominence=5 * noise)
+        prominences = np.sort(props["prominences"])
+        if len(peaks) < 2 or prominences[-2] < 0.25 * prominences[-1]:
+            self.logger.warning("Dual radial sweep did not resolve two peaks, sweeping axes separately")
+            return {}
+        
+        # Two most prominent peaks, in frequency order
+        top_two = np.sort(peaks[np.argsort(props["prominences"])[-2:]])
+        timestamp = datetime.now().isoformat()
+        measurements = {}
+        for axis, peak_idx in zip(('radial_x', 'radial_y'), top_two.tolist()):
+            peak_freq, uncertainty = self._refine_peak(frequencies, pmt_counts, peak_idx, step_size)
+            measurements[axis] = SecularMeasurement(
+                u_rf=u_rf,
+                v_end=v_end,
+                axis=axis,
+                frequency_khz=peak_freq,
+                uncertainty_khz=uncertainty,
+                timestamp=timestamp,
+                pmt_data=pmt_counts
+            )
+            self.logger.info(f"{axis} frequency: {peak_freq:.1f} ± {uncertainty:.1f} kHz")
+        return measurements
+    
+    def measure_secular_frequencies(self, u_rf: float, v_end: float,
+                                    axes: List[str]) -> List[Optional[SecularMeasurement]]:
+        """
+        Measure several axes at the same trap voltages.
+        
+        With run_dual_radial, radial_x and radial_y come from a single
+        sweep when it shows both peaks (see measure_dual_radial).
+        
+        Returns:
+            One entry per axis measured, in order (None where it failed);
+            shorter than axes if stopped part-way
+        """
+        dual = {}
+        if self.run_dual_radial and 'radial_x' in axes and 'radial_y' in axes:
+            dual = self.measure_dual_radial(u_rf, v_end)
+        
+        swept = self._sweep_axes(u_rf, v_end, [axis for axis in axes if axis not in dual])
+        results = []
+        n_swept = 0
+        for axis in axes:
+            if axis in dual:
+                results.append(dual[axis])
+            elif n_swept < len(swept):
+                results.append(swept[n_swept])
+                n_swept += 1
+            else:
+                break  # stopped part-way
+        return results
+    
+    def _sweep_axes(self, u_rf: float, v_end: float,
+                    axes: List[str]) -> List[Optional[SecularMeasurement]]:
+        """
+        Measure several axes at the same trap voltages, one sweep per axis.
+        
+        Each sweep is its own SECULAR_SWEEP request, with stop/pause checks
+        between them, so no single manager request runs longer than one
+        sweep.
+        
+        Returns:
+            One entry per axis measured, in order (None where it failed);
+            shorter than axes if stopped part-way
+        """
+        results = []
+        for axis in axes:
+            if self.check_stop():
+                break
+            self.pause_point()
+            results.append(self.measure_secular_frequency(u_rf, v_end, axis))
+        return results
+    
     def run_all_measurements(self) -> List[SecularMeasurement]:
         """
         Run all secular frequency measurements.
@@ -471,6 +732,9 @@ class SimCalibrationExperiment(BaseExperiment):
             List of all measurements
         """
         self.measurements = []
+        self._meas_arr = np.zeros(0, dtype=MEASUREMENT_DTYPE)
+        self._measurement_index = {}
+        self._last_set_voltages = None  # may have been changed since the last run
         
         # Calculate total number of measurements
         axes = ['radial_x', 'radial_y']  # Based on reference data format
@@ -479,34 +743,37 @@ class SimCalibrationExperiment(BaseExperiment):
         
         self.logger.info(f"Starting {self.total_measurements} measurements")
         
-        for u_rf in self.u_rf_values:
-            for v_end in self.v_end_values:
-                # Set trap voltages
-                if not self.set_trap_voltages(u_rf, v_end):
-                    self.logger.warning(f"Skipping U_RF={u_rf}, V_end={v_end} due to voltage setting failure")
-                    continue
+        # v_end outermost and U_RF snaking back and forth, so consecutive
+        # points differ by one U_RF step and V_end changes rarely
+        for u_rf, v_end in self._scan_schedule():
+            # Set trap voltages
+            if not self.set_trap_voltages(u_rf, v_end):
+                self.logger.warning(f"Skipping U_RF={u_rf}, V_end={v_end} due to voltage setting failure")
+                continue
+            
+            if self.check_stop():
+                self._flush_reference_data()
+                return self.measurements
+            
+            self.pause_point()
+            
+            # Measure each axis
+            measured = self.measure_secular_frequencies(u_rf, v_end, axes)
+            for axis, measurement in zip(axes, measured):
+                if measurement:
+                    self._add_measurement(measurement)
+                    # Save reference data, throttled
+                    self._reference_unsaved = True
+                    if time.monotonic() - self._last_reference_save >= self.reference_save_interval_s:
+                        self._flush_reference_data()
+                else:
+                    self.logger.warning(f"Failed to measure {axis} at U_RF={u_rf}, V_end={v_end}")
                 
-                # Measure each axis
-                for axis in axes:
-                    if self.check_stop():
-                        return self.measurements
-                    
-                    self.pause_point()
-                    
-                    # Measure
-                    measurement = self.measure_secular_frequency(u_rf, v_end, axis)
-                    
-                    if measurement:
-                        self.measurements.append(measurement)
-                        # Save reference data after each measurement
-                        self.save_reference_data()
-                    else:
-                        self.logger.warning(f"Failed to measure {axis} at U_RF={u_rf}, V_end={v_end}")
-                    
-                    self.current_measurement_index += 1
-                    progress = 10 + (self.current_measurement_index / self.total_measurements) * 70
-                    self.set_progress(progress)
+                self.current_measurement_index += 1
+                progress = 10 + (self.current_measurement_index / self.total_measurements) * 70
+                self.set_progress(progress)
         
+        self._flush_reference_data()
         return self.measurements
     
     def run_fit(self) -> Optional[FitResult]:
@@ -516,45 +783,42 @@ class SimCalibrationExperiment(BaseExperiment):
         Returns:
             FitResult with fitted parameters
         """
+        if not FIT_AVAILABLE:
+            self.logger.error(f"fit_Kappa_Chi_URF could not be imported from {self.fit_module_path}")
+            return None
+        
         self.logger.info("Running kappa/chi fit...")
         
         try:
-            # Add fit module to path
-            import sys
-            if str(self.fit_module_path) not in sys.path:
-                sys.path.insert(0, str(self.fit_module_path))
-            
-            from fit_Kappa_Chi_URF import DataSet, fit_chi_kappa_multi
-            
             # Build datasets from measurements
             datasets = []
             
-            # Group measurements by (u_rf, v_end)
-            grouped = {}
-            for m in self.measurements:
-                key = (m.u_rf, m.v_end)
-                if key not in grouped:
-                    grouped[key] = []
-                grouped[key].append(m)
+            # Group measurements by (u_rf, v_end) in one pass over them
+            # sorted by (u_rf, v_end), measurement order within a group
+            arr = self.measurement_array
+            order = np.lexsort((arr['v_end'], arr['u_rf']))
+            u_rf_col = arr['u_rf'].tolist()
+            v_end_col = arr['v_end'].tolist()
+            axis_col = arr['axis'].tolist()
             
             # Create DataSet for each (u_rf, v_end) combination
-            for (u_rf, v_end), meas_list in grouped.items():
-                # Separate by axis
-                radial_x = [m for m in meas_list if m.axis == 'radial_x']
-                radial_y = [m for m in meas_list if m.axis == 'radial_y']
-                axial = [m for m in meas_list if m.axis == 'axial']
+            for (u_rf, v_end), rows in itertools.groupby(
+                order.tolist(), key=lambda i: (u_rf_col[i], v_end_col[i])
+            ):
+                # First measurement per axis in the group
+                first = {}
+                for i in rows:
+                    first.setdefault(axis_col[i], i)
                 
                 # Create radial dataset (wx, wy)
-                if radial_x and radial_y:
-                    freqs = [radial_x[0].frequency_khz, radial_y[0].frequency_khz]
-                    sigmas = [radial_x[0].uncertainty_khz or 0.5, 
-                             radial_y[0].uncertainty_khz or 0.5]
+                if 'radial_x' in first and 'radial_y' in first:
+                    radial = arr[[first['radial_x'], first['radial_y']]]
                     
                     ds = DataSet(
                         masses_A=self.ion_masses,
-                        measured_kHz=freqs,
+                        measured_kHz=radial['freq'].tolist(),
                         which_modes='radial',
-                        sigma_kHz=sigmas,
+                        sigma_kHz=radial['unc'].tolist(),
                         u_RF=u_rf,
                         v_end=v_end,
                         name=f"U{u_rf:.1f}V_V{v_end:.1f}V"
@@ -627,8 +891,7 @@ class SimCalibrationExperiment(BaseExperiment):
             config_file = Path(self.data_dir) / "sim_calibration_config.json"
             self.data_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            config_file.write_text(json.dumps(config_data, indent=2))
             
             self.logger.info(f"Config saved to: {config_file}")
             
@@ -644,8 +907,38 @@ class SimCalibrationExperiment(BaseExperiment):
             self.logger.error(f"Failed to update config: {e}")
             return False
     
+    def _save_sweeps(self, filepath: Path) -> Optional[str]:
+        """
+        Write the raw PMT sweeps to a compressed .npz next to the JSON summary.
+        
+        Row i of "sweeps" is measurement "index"[i] of the summary, padded
+        with -1 to the longest sweep ("n_points" holds the real lengths).
+        
+        Returns:
+            File name, or None if no measurement has sweep data
+        """
+        rows = [(i, m) for i, m in enumerate(self.measurements) if m.pmt_data is not None]
+        if not rows:
+            return None
+        
+        n_points = np.array([len(m.pmt_data) for _, m in rows], dtype=np.int32)
+        sweeps = np.full((len(rows), int(n_points.max())), -1, dtype=np.int32)
+        for row, (_, m) in zip(sweeps, rows):
+            row[:len(m.pmt_data)] = m.pmt_data
+        
+        np.savez_compressed(
+            filepath,
+            sweeps=sweeps,
+            n_points=n_points,
+            index=np.array([i for i, _ in rows], dtype=np.int32),
+            u_rf=np.array([m.u_rf for _, m in rows]),
+            v_end=np.array([m.v_end for _, m in rows]),
+            axis=np.array([m.axis for _, m in rows])
+        )
+        return filepath.name
+    
     def save_measurement_data(self):
-        """Save all measurement data to JSON."""
+        """Save all measurement data to JSON (raw sweeps to a separate .npz)."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"sim_calibration_{timestamp}.json"
         filepath = self.data_dir / filename
@@ -673,11 +966,16 @@ class SimCalibrationExperiment(BaseExperiment):
                 }
                 for m in self.measurements
             ],
+            "sweeps_file": self._save_sweeps(filepath.with_name(f"sim_calibration_{timestamp}_sweeps.npz")),
             "fit_result": asdict(self.fit_result) if self.fit_result else None
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            # numpy scalars (fit values) via tolist()
+            raw = json.dumps(data, indent=2, default=lambda o: o.tolist()).encode()
+        filepath.write_bytes(raw)
         
         self.logger.info(f"Measurement data saved to: {filepath}")
         return str(filepath)
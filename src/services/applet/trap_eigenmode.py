@@ -23,41 +23,152 @@ Usage:
     # or via applet server API
 """
 
+import os
 import sys
 import time
+import csv
 import json
+import re
+import base64
+import hashlib
 import logging
+import functools
+import threading
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 
 try:
-    # Try absolute import first (when src is in path)
-    from analysis.eigenmodes.trap_sim_asy import calculate_eigenmode, modes_dataframe, _format_df
-    from analysis.eigenmodes.trap_sim_asy import DEFAULT_TRAP_PARAMS
+    from analysis.eigenmodes.trap_sim_asy import calculate_eigenmode, modes_table, DEFAULT_TRAP_PARAMS
     ANALYSIS_AVAILABLE = True
-except ImportError:
-    # Fall back to relative import from parent directory (src)
-    try:
-        from ..analysis.eigenmodes.trap_sim_asy import calculate_eigenmode, modes_dataframe, _format_df
-        from ..analysis.eigenmodes.trap_sim_asy import DEFAULT_TRAP_PARAMS
-        ANALYSIS_AVAILABLE = True
-    except ImportError as e:
-        logging.warning(f"analysis module not available, trap_eigenmode experiment disabled: {e}")
-        ANALYSIS_AVAILABLE = False
-        # Define placeholders to prevent NameError
-        calculate_eigenmode = None
-        modes_dataframe = None
-        _format_df = None
-        DEFAULT_TRAP_PARAMS = None
+except ImportError as e:
+    logging.warning(f"analysis module not available, trap_eigenmode experiment disabled: {e}")
+    ANALYSIS_AVAILABLE = False
+    # Define placeholders to prevent NameError
+    calculate_eigenmode = None
+    modes_table = None
+    DEFAULT_TRAP_PARAMS = None
 
 from .base import BaseExperiment, ExperimentStatus, ExperimentResult
 
 
+# On-disk eigenmode cache: <data_dir>/.eigcache/<sha1 of inputs>.npz
+EIGENMODE_CACHE_DIR = ".eigcache"
+# Decimals kept from float inputs before they form a cache key
+_CACHE_DECIMALS = 6
+
+
+# Renders eigenmode table PNGs off the experiment thread
+_PLOTTER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eigenmode-plot")
+
+# Eigenmode table figures, keyed by table shape and reused across runs:
+# (figure, axes, table, bbox to save). Agg canvases, no pyplot state.
+_TABLE_FIGURES: Dict[Tuple[int, int], Tuple[Any, Any, Any, Any]] = {}
+_TABLE_FIGURES_LOCK = threading.Lock()
+
+
+# Wire layout of EigenmodeResult.modes_blob() for N ions (n = 3N modes),
+# one contiguous little-endian float64 buffer, base64 encoded for JSON
+MODES_BLOB_LAYOUT = "<f8: frequencies_hz[n], eigenvectors[n, n] (column k = mode k), coordinates_m[N, 3]"
+
+
+def decode_modes_blob(blob: str, n_ions: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Unpack a modes_blob recorded by the trap_eigenmode experiment.
+    
+    Returns:
+        (frequencies_hz, eigenvectors, coordinates) as read-only views
+    """
+    n = 3 * n_ions
+    buf = np.frombuffer(base64.b64decode(blob), dtype="<f8")
+    if buf.size != n + n * n + n:
+        raise ValueError(f"modes_blob holds {buf.size} values, expected {n + n * n + n} for {n_ions} ions")
+    return buf[:n], buf[n:n + n * n].reshape(n, n), buf[n + n * n:].reshape(n_ions, 3)
+
+
+# Separators between mass numbers in a plain string ("9,3", "9 3", "9, 3")
+_MASS_SEPARATORS = re.compile(r'[,\s]+')
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_masses_str(masses_input: str) -> Tuple[int, ...]:
+    """Mass numbers from a JSON list or a comma/space separated string."""
+    # Try JSON first
+    try:
+        parsed = json.loads(masses_input)
+        if isinstance(parsed, list):
+            return tuple(int(m) for m in parsed)
+    except json.JSONDecodeError:
+        pass
+    
+    return tuple(map(int, filter(None, _MASS_SEPARATORS.split(masses_input.strip()))))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_eigenmode(
+    u_rf: float,
+    ec1: float,
+    ec2: float,
+    masses: Tuple[int, ...],
+    rf_mhz: float,
+    trap: Tuple[float, float, Tuple[float, ...], Tuple[float, ...]],
+    cache_dir: Path
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    calculate_eigenmode() memoized in memory and as .npz files in cache_dir.
+    
+    Args are the (rounded) inputs; trap is (r_0, z_0, kappa, chi). The
+    returned arrays are shared between calls and therefore read-only.
+    """
+    r_0, z_0, kappa, chi = trap
+    digest = hashlib.sha1(repr((u_rf, ec1, ec2, masses, rf_mhz, trap)).encode()).hexdigest()
+    cache_file = cache_dir / f"{digest}.npz"
+    
+    result = None
+    if cache_file.exists():
+        try:
+            with np.load(cache_file) as f:
+                result = (f['frequencies_hz'], f['eigenvectors'], f['z_equilibrium'], f['coordinates'])
+        except (OSError, ValueError, KeyError) as e:
+            logging.getLogger(__name__).warning(f"Ignoring unreadable eigenmode cache {cache_file}: {e}")
+    
+    if result is None:
+        result = calculate_eigenmode(
+            u_rf=u_rf,
+            ec1=ec1,
+            ec2=ec2,
+            masses=list(masses),
+            r_0=r_0,
+            z_0=z_0,
+            rf_mhz=rf_mhz,
+            kappa=list(kappa),
+            chi=list(chi),
+            verbose=False
+        )
+        # Write to a temp file and swap it in so readers never see a partial file
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                np.savez(
+                    f,
+                    frequencies_hz=result[0],
+                    eigenvectors=result[1],
+                    z_equilibrium=result[2],
+                    coordinates=result[3]
+                )
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Could not write eigenmode cache {cache_file}: {e}")
+    
+    for arr in result:
+        arr.flags.writeable = False
+    return result
+
+
 @dataclass
 class EigenmodeResult:
     """Container for eigenmode calculation results."""
@@ -65,10 +176,49 @@ class EigenmodeResult:
     eigenvectors: np.ndarray
     z_equilibrium: np.ndarray
     coordinates: np.ndarray
-    dataframe: pd.DataFrame
+    # The same positions in µm, scaled once for logging and recording
+    z_equilibrium_um: np.ndarray
+    coordinates_um: np.ndarray
+    # Eigenmode table (see trap_sim_asy.modes_table): column names, mode
+    # labels and [freq kHz, eigenvector components] rows
+    mode_columns: List[str]
+    mode_labels: List[str]
+    mode_values: np.ndarray
     trap_params: Dict[str, Any]
     ion_masses: List[int]
     crystal_angle_deg: Optional[float] = None
+    
+    @property
+    def dataframe(self) -> "pd.DataFrame":
+        """Eigenmode table as a DataFrame (built on access)."""
+        import pandas as pd
+        
+        df = pd.DataFrame(self.mode_values, columns=self.mode_columns[1:])
+        df.insert(0, self.mode_columns[0], self.mode_labels)
+        return df
+    
+    def mode_records(self) -> List[Dict[str, Any]]:
+        """Eigenmode table as one dict per mode (column name -> value)."""
+        return [
+            dict(zip(self.mode_columns, [label, *row]))
+            for label, row in zip(self.mode_labels, self.mode_values.tolist())
+        ]
+    
+    def modes_blob(self) -> str:
+        """Frequencies, eigenvectors and coordinates packed per MODES_BLOB_LAYOUT."""
+        buf = np.concatenate((
+            self.frequencies_hz.ravel(),
+            self.eigenvectors.ravel(),
+            self.coordinates.ravel(),
+        )).astype("<f8", copy=False)
+        return base64.b64encode(buf.tobytes()).decode("ascii")
+    
+    def mode_cells(self) -> List[List[str]]:
+        """Eigenmode table formatted for display, one list of strings per mode."""
+        return [
+            [label, f"{row[0]:,.3f}", *(f"{x: .4f}" for x in row[1:])]
+            for label, row in zip(self.mode_labels, self.mode_values.tolist())
+        ]
 
 
 class TrapEigenmodeExperiment(BaseExperiment):
@@ -88,13 +238,15 @@ class TrapEigenmodeExperiment(BaseExperiment):
         theta_deg: Rotation angle [degrees]
         z_offset_um: Z offset [micrometers]
         rf_mhz: RF frequency [MHz] (default: 35.8515)
+        produce_artifacts: Write CSV table and PNG plot (default: True)
     """
     
     def __init__(
         self,
         manager_host: str = "localhost",
         manager_port: int = 5557,
-        data_dir: str = "data/experiments"
+        data_dir: str = "data/experiments",
+        produce_artifacts: bool = True
     ):
         super().__init__(
             name="trap_eigenmode",
@@ -103,6 +255,10 @@ class TrapEigenmodeExperiment(BaseExperiment):
             data_dir=data_dir
         )
         
+        # Write the CSV table and PNG plot; off for callers that only
+        # need the numbers in the result data
+        self.produce_artifacts = produce_artifacts
+        
         # Default parameters
         self.u_rf: float = 200.0
         self.ec1: float = 10.0
@@ -112,6 +268,7 @@ class TrapEigenmodeExperiment(BaseExperiment):
         
         # Results
         self.eigenmode_result: Optional[EigenmodeResult] = None
+        self.plot_future: Optional[Future] = None  # PNG render on _PLOTTER
     
     def parse_masses(self, masses_input) -> List[int]:
         """
@@ -124,23 +281,13 @@ class TrapEigenmodeExperiment(BaseExperiment):
             - JSON string: "[9, 3]"
         """
         if isinstance(masses_input, list):
+            # Already a list of ints (e.g. from the CLI): nothing to convert
+            if all(type(m) is int for m in masses_input):
+                return masses_input
             return [int(m) for m in masses_input]
         
         if isinstance(masses_input, str):
-            # Try JSON first
-            try:
-                parsed = json.loads(masses_input)
-                if isinstance(parsed, list):
-                    return [int(m) for m in parsed]
-            except json.JSONDecodeError:
-                pass
-            
-            # Try comma-separated
-            if ',' in masses_input:
-                return [int(m.strip()) for m in masses_input.split(',')]
-            
-            # Try space-separated
-            return [int(m.strip()) for m in masses_input.split()]
+            return list(_parse_masses_str(masses_input))
         
         raise ValueError(f"Cannot parse masses: {masses_input}")
     
@@ -151,42 +298,51 @@ class TrapEigenmodeExperiment(BaseExperiment):
         Returns:
             EigenmodeResult with all calculation results
         """
-        self.logger.info("="*60)
-        self.logger.info("TRAP EIGENMODE CALCULATION")
-        self.logger.info("="*60)
-        self.logger.info(f"RF Voltage: {self.u_rf} V")
-        self.logger.info(f"EC1: {self.ec1} V")
-        self.logger.info(f"EC2: {self.ec2} V")
-        self.logger.info(f"Ion masses: {self.masses} u")
-        self.logger.info(f"RF frequency: {self.rf_mhz} MHz")
-        
-        # Calculate eigenmodes
-        freqs_hz, eigenvectors, z_eq, coords = calculate_eigenmode(
-            u_rf=self.u_rf,
-            ec1=self.ec1,
-            ec2=self.ec2,
-            masses=self.masses,
-            rf_mhz=self.rf_mhz,
-            verbose=False
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("="*60)
+            self.logger.info("TRAP EIGENMODE CALCULATION")
+            self.logger.info("="*60)
+            self.logger.info(f"RF Voltage: {self.u_rf} V")
+            self.logger.info(f"EC1: {self.ec1} V")
+            self.logger.info(f"EC2: {self.ec2} V")
+            self.logger.info(f"Ion masses: {self.masses} u")
+            self.logger.info(f"RF frequency: {self.rf_mhz} MHz")
+        
+        # Calculate eigenmodes (cached per rounded parameter set)
+        freqs_hz, eigenvectors, z_eq, coords = _cached_eigenmode(
+            round(self.u_rf, _CACHE_DECIMALS),
+            round(self.ec1, _CACHE_DECIMALS),
+            round(self.ec2, _CACHE_DECIMALS),
+            tuple(self.masses),
+            round(self.rf_mhz, _CACHE_DECIMALS),
+            (
+                DEFAULT_TRAP_PARAMS['r_0'],
+                DEFAULT_TRAP_PARAMS['z_0'],
+                tuple(DEFAULT_TRAP_PARAMS['kappa']),
+                tuple(DEFAULT_TRAP_PARAMS['chi'])
+            ),
+            self.data_dir / EIGENMODE_CACHE_DIR
         )
         
-        # Create DataFrame
-        df = modes_dataframe(freqs_hz, eigenvectors)
+        # Eigenmode table
+        columns, labels, values = modes_table(freqs_hz, eigenvectors)
         
         # Calculate crystal angle for 2-ion case
         crystal_angle = None
         if len(self.masses) >= 2:
-            dx = coords[0][0] - coords[1][0]
-            dy = coords[0][1] - coords[1][1]
-            dz = coords[0][2] - coords[1][2]
-            crystal_angle = np.arctan(np.sqrt(dx**2 + dy**2) / abs(dz)) * 360 / (2*np.pi)
+            d = coords[0] - coords[1]
+            crystal_angle = float(np.degrees(np.arctan2(np.hypot(d[0], d[1]), abs(d[2]))))
         
         result = EigenmodeResult(
             frequencies_hz=freqs_hz,
             eigenvectors=eigenvectors,
             z_equilibrium=z_eq,
             coordinates=coords,
-            dataframe=df,
+            z_equilibrium_um=z_eq * 1e6,
+            coordinates_um=coords * 1e6,
+            mode_columns=columns,
+            mode_labels=labels,
+            mode_values=values,
             trap_params={
                 'u_rf': self.u_rf,
                 'ec1': self.ec1,
@@ -215,46 +371,45 @@ class TrapEigenmodeExperiment(BaseExperiment):
         filename = f"eigenmode_{masses_str}_{int(result.trap_params['u_rf'])}V_{timestamp}.csv"
         filepath = self.data_dir / filename
         
-        # Save DataFrame
-        result.dataframe.to_csv(filepath, index=False)
+        # Save table (same layout as DataFrame.to_csv(index=False))
+        with open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(result.mode_columns)
+            writer.writerows(
+                [label, *row] for label, row in zip(result.mode_labels, result.mode_values.tolist())
+            )
         self.logger.info(f"Eigenmode table saved to: {filepath}")
         
         return str(filepath)
     
-    def create_visualization(self, result: EigenmodeResult) -> str:
+    @staticmethod
+    def _build_table_figure(columns: List[str], cells: List[List[str]], title: str) -> Tuple[Any, Any, Any, Any]:
         """
-        Create and save eigenmode visualization.
+        Lay out the styled eigenmode table figure for one table shape.
         
         Returns:
-            Path to saved PNG file
+            (figure, axes, table, tight bounding box to save with)
         """
-        df_fmt = _format_df(result.dataframe)
-        rows, cols = df_fmt.shape
+        # Imported here so runs without artifacts never load matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        rows, cols = len(cells), len(columns)
         
         # Calculate figure size
         fig_w = max(8.0, cols * 1.0)
         fig_h = max(4.0, rows * 0.5 + 2)
         
-        fig, ax = plt.subplots(figsize=(fig_w, fig_h))
+        fig = Figure(figsize=(fig_w, fig_h))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.subplots()
         ax.axis("off")
-        
-        masses_str = " ".join(map(str, result.ion_masses))
-        title = (
-            f"Normal modes for ions: {masses_str}\n"
-            f"U_RF={result.trap_params['u_rf']} V, "
-            f"EC1={result.trap_params['ec1']} V, "
-            f"EC2={result.trap_params['ec2']} V, "
-            f"Ω={result.trap_params['rf_mhz']:.2f} MHz"
-        )
-        if result.crystal_angle_deg is not None:
-            title += f", θ_crystal={result.crystal_angle_deg:.1f}°"
-        
         ax.set_title(title, fontsize=10)
         
         # Create table
         tbl = ax.table(
-            cellText=df_fmt.values,
-            colLabels=df_fmt.columns,
+            cellText=cells,
+            colLabels=columns,
             loc="center",
             cellLoc='center'
         )
@@ -262,41 +417,116 @@ class TrapEigenmodeExperiment(BaseExperiment):
         tbl.set_fontsize(8)
         tbl.scale(1.2, 1.5)
         
-        # Color header
-        for i in range(len(df_fmt.columns)):
-            tbl[(0, i)].set_facecolor('#40466e')
-            tbl[(0, i)].set_text_props(weight='bold', color='white')
-        
-        # Alternate row colors
-        for i in range(1, len(df_fmt) + 1):
-            for j in range(len(df_fmt.columns)):
-                if i % 2 == 0:
-                    tbl[(i, j)].set_facecolor('#f0f0f0')
+        # Color header and alternate rows in one pass over the cells
+        for (i, _), cell in tbl.get_celld().items():
+            if i == 0:
+                cell.set_facecolor('#40466e')
+                cell.set_text_props(weight='bold', color='white')
+            elif i % 2 == 0:
+                cell.set_facecolor('#f0f0f0')
         
         fig.tight_layout()
         
-        # Save
+        # Tight bounding box (as bbox_inches='tight' would find it), worked
+        # out once so later saves skip that extra layout pass
+        bbox = fig.get_tightbbox(canvas.get_renderer()).padded(0.1)
+        return fig, ax, tbl, bbox
+    
+    def visualization_path(self, result: EigenmodeResult) -> Path:
+        """Path the eigenmode visualization of result is saved to."""
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         masses_slug = "-".join(map(str, result.ion_masses))
         filename = f"eigenmode_{masses_slug}_{int(result.trap_params['u_rf'])}V_{timestamp}.png"
-        filepath = self.data_dir / filename
+        return self.data_dir / filename
+    
+    def create_visualization(self, result: EigenmodeResult, filepath: Optional[Path] = None) -> str:
+        """
+        Create and save eigenmode visualization.
+        
+        Args:
+            result: Eigenmode calculation to plot
+            filepath: Output PNG path (default: visualization_path(result))
+        
+        Returns:
+            Path to saved PNG file
+        """
+        if filepath is None:
+            filepath = self.visualization_path(result)
         
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig)
+        cells = result.mode_cells()
+        rows, cols = len(cells), len(result.mode_columns)
+        
+        masses_str = " ".join(map(str, result.ion_masses))
+        title = (
+            f"Normal modes for ions: {masses_str}\n"
+            f"U_RF={result.trap_params['u_rf']} V, "
+            f"EC1={result.trap_params['ec1']} V, "
+            f"EC2={result.trap_params['ec2']} V, "
+            f"Ω={result.trap_params['rf_mhz']:.2f} MHz"
+        )
+        if result.crystal_angle_deg is not None:
+            title += f", θ_crystal={result.crystal_angle_deg:.1f}°"
+        
+        with _TABLE_FIGURES_LOCK:
+            cached = _TABLE_FIGURES.get((rows, cols))
+            if cached is None:
+                cached = self._build_table_figure(result.mode_columns, cells, title)
+                _TABLE_FIGURES[(rows, cols)] = cached
+            else:
+                # Same layout as last time: only swap in the new text
+                _, ax, tbl, _ = cached
+                ax.set_title(title, fontsize=10)
+                celld = tbl.get_celld()
+                for i, row in enumerate(cells, 1):
+                    for j, text in enumerate(row):
+                        celld[i, j].get_text().set_text(text)
+            
+            fig, _, _, bbox = cached
+            fig.savefig(filepath, dpi=150, bbox_inches=bbox, facecolor='white')
         
         self.logger.info(f"Visualization saved to: {filepath}")
         return str(filepath)
     
+    def _on_plot_done(self, future: Future):
+        """Log a failed background render."""
+        try:
+            future.result()
+        except Exception as e:
+            self.logger.error(f"Creating visualization failed: {e}")
+    
+    def await_plots(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the PNG started by run() to be written.
+        
+        Returns:
+            Path to saved PNG file, or None if no render was started
+        """
+        if self.plot_future is None:
+            return None
+        return self.plot_future.result(timeout)
+    
+    def cleanup(self):
+        """Let a pending PNG render finish, then clean up as usual."""
+        if self.plot_future is not None:
+            try:
+                self.plot_future.result()
+            except Exception:
+                pass  # already logged by _on_plot_done
+        super().cleanup()
+    
     def print_results(self, result: EigenmodeResult):
         """Print results to console/log."""
+        # Quiet runs (e.g. scan sweeps at WARNING) skip all the formatting
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info("\n" + "="*60)
         self.logger.info("RESULTS")
         self.logger.info("="*60)
         
-        self.logger.info(f"\nZ-equilibrium positions [µm]: {result.z_equilibrium * 1e6}")
-        self.logger.info(f"\nCartesian coordinates [µm]:")
-        for i, coord in enumerate(result.coordinates):
-            self.logger.info(f"  Ion {i+1}: ({coord[0]*1e6:.3f}, {coord[1]*1e6:.3f}, {coord[2]*1e6:.3f})")
+        self.logger.info(f"\nZ-equilibrium positions [µm]: {result.z_equilibrium_um}")
+        coords_um = np.array2string(result.coordinates_um, precision=3, suppress_small=True)
+        self.logger.info(f"\nCartesian coordinates [µm] (one row per ion, x y z):\n{coords_um}")
         
         if result.crystal_angle_deg is not None:
             self.logger.info(f"\nCrystal angle with z-axis: {result.crystal_angle_deg:.2f}°")
@@ -305,7 +535,11 @@ class TrapEigenmodeExperiment(BaseExperiment):
         for i, freq in enumerate(result.frequencies_hz):
             self.logger.info(f"  Mode {i}: {freq/1e3:.3f} kHz")
         
-        self.logger.info(f"\nEigenmode table:\n{result.dataframe.to_string(index=False)}")
+        # Right-aligned text table of the display cells
+        table = [result.mode_columns] + result.mode_cells()
+        widths = [max(len(row[j]) for row in table) for j in range(len(result.mode_columns))]
+        text = "\n".join(" ".join(cell.rjust(w) for cell, w in zip(row, widths)) for row in table)
+        self.logger.info(f"\nEigenmode table:\n{text}")
     
     def run(self) -> ExperimentResult:
         """
@@ -345,22 +579,33 @@ class TrapEigenmodeExperiment(BaseExperiment):
             self.set_progress(80)
             
             # Save outputs
-            csv_path = self.save_eigenmode_table(self.eigenmode_result)
-            png_path = self.create_visualization(self.eigenmode_result)
-            
-            # Record data
-            self.record_data("frequencies_hz", self.eigenmode_result.frequencies_hz.tolist())
-            self.record_data("frequencies_khz", (self.eigenmode_result.frequencies_hz / 1e3).tolist())
-            self.record_data("z_equilibrium_um", (self.eigenmode_result.z_equilibrium * 1e6).tolist())
-            self.record_data("coordinates_um", (self.eigenmode_result.coordinates * 1e6).tolist())
-            self.record_data("trap_params", self.eigenmode_result.trap_params)
-            self.record_data("ion_masses", self.eigenmode_result.ion_masses)
-            self.record_data("crystal_angle_deg", self.eigenmode_result.crystal_angle_deg)
-            self.record_data("csv_path", csv_path)
-            self.record_data("png_path", png_path)
+            csv_path = png_path = None
+            if self.produce_artifacts:
+                csv_path = self.save_eigenmode_table(self.eigenmode_result)
+                
+                # Render the PNG in the background; see await_plots()
+                png_path = str(self.visualization_path(self.eigenmode_result))
+                self.plot_future = _PLOTTER.submit(
+                    self.create_visualization, self.eigenmode_result, Path(png_path)
+                )
+                self.plot_future.add_done_callback(self._on_plot_done)
             
-            # Store DataFrame as dict for JSON serialization
-            self.record_data("eigenmode_table", self.eigenmode_result.dataframe.to_dict(orient='records'))
+            # Record data (JSON-ready values, one bulk update). Eigenvectors
+            # and positions travel as one packed buffer instead of nested
+            # lists; decode with decode_modes_blob(modes_blob, len(ion_masses))
+            eig = self.eigenmode_result
+            freqs_hz = eig.frequencies_hz.tolist()
+            self.record_data_bulk({
+                "frequencies_hz": freqs_hz,
+                "frequencies_khz": [f / 1e3 for f in freqs_hz],
+                "modes_blob": eig.modes_blob(),
+                "modes_layout": MODES_BLOB_LAYOUT,
+                "trap_params": eig.trap_params,
+                "ion_masses": eig.ion_masses,
+                "crystal_angle_deg": eig.crystal_angle_deg,
+                "csv_path": csv_path,
+                "png_path": png_path,
+            })
             
             self.set_progress(100)
             
@@ -425,6 +670,8 @@ Examples:
                         help=f"RF frequency [MHz] (default: {DEFAULT_TRAP_PARAMS['rf_mhz']})")
     parser.add_argument("--data-dir", default="data/experiments",
                         help="Output directory (default: data/experiments)")
+    parser.add_argument("--no-artifacts", action="store_true",
+                        help="Skip writing the CSV table and PNG plot")
     
     args = parser.parse_args()
     
@@ -435,7 +682,7 @@ Examples:
     )
     
     # Create and configure experiment
-    exp = TrapEigenmodeExperiment(data_dir=args.data_dir)
+    exp = TrapEigenmodeExperiment(data_dir=args.data_dir, produce_artifacts=not args.no_artifacts)
     exp.u_rf = args.u_rf
     exp.ec1 = args.ec1
     exp.ec2 = args.ec2
@@ -451,16 +698,21 @@ Examples:
     print(f"Ion masses: {args.masses} u")
     print("="*60)
     
-    # Run experiment
+    # Run experiment (and wait for the PNG before reporting it)
     result = exp.run()
+    if result.success:
+        try:
+            exp.await_plots()
+        except Exception as e:
+            print(f"Visualization failed: {e}")
     
     print("\n" + "="*60)
     if result.success:
         print("RESULT: SUCCESS")
         print(f"Message: {result.message}")
         print(f"\nOutput files:")
-        print(f"  CSV: {result.data.get('csv_path', 'N/A')}")
-        print(f"  PNG: {result.data.get('png_path', 'N/A')}")
+        print(f"  CSV: {result.data.get('csv_path') or 'N/A'}")
+        print(f"  PNG: {result.data.get('png_path') or 'N/A'}")
     else:
         print("RESULT: FAILED")
         print(f"Error: {result.error}")
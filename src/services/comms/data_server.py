@@ -85,6 +85,22 @@ def store_data_point(channel: str, value: float, timestamp: float):
     return True
 
 
+def store_data_points(values: Dict[str, float], timestamp: float) -> int:
+    """Store one data point per channel under a single lock acquisition.
+    
+    Unknown channels are skipped. Returns the number of points stored.
+    """
+    points = [
+        (channel, float(value)) for channel, value in values.items()
+        if channel in _shared_telemetry_data
+    ]
+    
+    with _telemetry_lock:
+        for channel, value in points:
+            _shared_telemetry_data[channel].append((timestamp, value))
+    return len(points)
+
+
 def update_data_source(source: str, timestamp: float, increment_count: int = 1):
     """Update data source status (called by Manager)."""
     with _sources_lock:
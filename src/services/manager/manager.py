@@ -973,6 +973,10 @@ class ControlManager:
         "dds_freq_mhz": (0, 200), # DDS frequency 0-200 MHz (LabVIEW only)
     }
     
+    # Longest PMT_SCAN one request may run (ms of settle + gate). The REP
+    # loop answers no one else meanwhile, so longer sweeps are sent in chunks.
+    PMT_SCAN_MAX_MS = 2000.0
+    
     def __init__(self):
         """Initialize the control manager."""
         # Setup logging
@@ -1486,6 +1490,10 @@ class ControlManager:
             
             elif action == "PMT_MEASURE":
                 return self._handle_pmt_measure(req)
+            elif action == "PMT_SCAN":
+                return self._handle_pmt_scan(req)
+            elif action == "SET_MEASURE":
+                return self._handle_set_measure(req)
             elif action == "CAM_SWEEP":
                 return self._handle_cam_sweep(req)
             elif action == "SECULAR_SWEEP":
@@ -2848,6 +2856,106 @@ class ControlManager:
             "code": "PMT_TIMEOUT"
         }
     
+    def _handle_pmt_scan(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle PMT_SCAN command - Step one parameter and measure PMT at each value.
+        
+        Runs a SET -> settle -> PMT_MEASURE sweep inside the manager so the
+        client pays one request round-trip instead of two per point. The
+        command socket is busy for the whole request, so a request may take
+        at most PMT_SCAN_MAX_MS (a single point is always allowed); clients
+        split longer sweeps into chunks.
+        
+        Request format:
+        {
+            "action": "PMT_SCAN",
+            "channel": "comp_v",
+            "values": [30.0, 31.0, ...],
+            "settling_ms": 500.0,
+            "duration_ms": 300.0
+        }
+        
+        Response format:
+        {
+            "status": "success",
+            "channel": "comp_v",
+            "values": [...],
+            "counts": [1234, null, ...]  # null where SET or measurement failed
+        }
+        """
+        channel = req.get("channel")
+        values = req.get("values", [])
+        settling_ms = req.get("settling_ms", 0.0)
+        duration_ms = req.get("duration_ms", 100.0)
+        source = req.get("source", "UNKNOWN")
+        
+        if channel not in self.VALID_PARAMS:
+            return {"status": "error", "message": f"Invalid scan channel: {channel}",
+                    "code": "VALIDATION_ERROR"}
+        
+        scan_ms = len(values) * (settling_ms + duration_ms)
+        if len(values) > 1 and scan_ms > self.PMT_SCAN_MAX_MS:
+            return {"status": "error",
+                    "message": f"PMT_SCAN of {scan_ms:.0f}ms exceeds {self.PMT_SCAN_MAX_MS:.0f}ms per request",
+                    "code": "SCAN_TOO_LONG"}
+        
+        self.logger.info(f"PMT_SCAN requested: {channel} over {len(values)} points, "
+                        f"settling={settling_ms}ms, duration={duration_ms}ms")
+        
+        counts = []
+        for value in values:
+            set_result = self._handle_set({"params": {channel: value}, "source": source})
+            if set_result.get("status") != "success":
+                self.logger.warning(f"PMT_SCAN: failed to set {channel}={value}: "
+                                    f"{set_result.get('message')}")
+                counts.append(None)
+                continue
+            
+            time.sleep(settling_ms / 1000.0)
+            
+            result = self._handle_pmt_measure({"duration_ms": duration_ms, "exp_id": req.get("exp_id")})
+            counts.append(result.get("counts") if result.get("status") == "success" else None)
+        
+        return {
+            "status": "success",
+            "channel": channel,
+            "values": values,
+            "counts": counts
+        }
+    
+    def _handle_set_measure(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle SET_MEASURE command - Set parameters, settle, then measure PMT.
+        
+        Fuses SET and PMT_MEASURE so a scan point costs one request
+        round-trip regardless of how many channels it sets.
+        
+        Request format:
+        {
+            "action": "SET_MEASURE",
+            "params": {"comp_v": 40.0, "comp_h": 1.5},
+            "settle_ms": 500.0,
+            "duration_ms": 300.0
+        }
+        
+        Response format:
+        {
+            "status": "success",
+            "counts": 1234
+        }
+        """
+        settle_ms = req.get("settle_ms", 0.0)
+        
+        set_result = self._handle_set({"params": req.get("params", {}),
+                                       "source": req.get("source", "UNKNOWN")})
+        if set_result.get("status") != "success":
+            return set_result
+        
+        time.sleep(settle_ms / 1000.0)
+        
+        return self._handle_pmt_measure({"duration_ms": req.get("duration_ms", 100.0),
+                                         "exp_id": req.get("exp_id")})
+    
     def _handle_cam_sweep(self, req: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle CAM_SWEEP command - Run secular sweep with synchronized camera capture.